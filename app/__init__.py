@@ -6,14 +6,29 @@
 import os
 
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
 
 from app.routes import main
 
 
-def create_app(data_file_path: str = None, reports_dir: str = None):
+def create_app(
+    data_file_path: str = None, reports_dir: str = None, template_cache_dir: str = None
+):
     """Create and configure the Flask application."""
     app = Flask(__name__)
 
+    # Optionally keep compiled page templates on disk so restarts skip
+    # recompiling them; the directory must not be shared with other apps
+    if template_cache_dir is None:
+        template_cache_dir = os.getenv("DHF_TEMPLATE_CACHE_DIR")
+    if template_cache_dir:
+        os.makedirs(template_cache_dir, exist_ok=True)
+        app.jinja_options = {
+            **app.jinja_options,
+            "bytecode_cache": FileSystemBytecodeCache(template_cache_dir),
+        }
+    app.config["DHF_TEMPLATE_CACHE_DIR"] = template_cache_dir
+
     # Configuration
     app.config[
         "SECRET_KEY"
@@ -3,11 +3,45 @@
 
 """Data utilities for loading and managing DHF YAML data."""
 
+import functools
+import itertools
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import yaml
 
+# libyaml's C loader and dumper are about ten times faster than the pure-Python ones
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+# Shared by all managers, so a version identifies one snapshot of one manager's data
+_data_versions = itertools.count(1)
+
+
+# Only a handful of ID combinations exist, so each score is worked out once
+@functools.lru_cache(maxsize=1024)
+def _rbm_score(
+    probability_occurrence_id: str, probability_harm_id: str, severity_id: str
+) -> int:
+    """Calculate the RBM score for the given option IDs."""
+    # Map IDs to numeric values (1, 2, 3)
+    po_value = (
+        int(probability_occurrence_id.replace("PO", ""))
+        if probability_occurrence_id.startswith("PO")
+        else 1
+    )
+    ph_value = (
+        int(probability_harm_id.replace("PH", ""))
+        if probability_harm_id.startswith("PH")
+        else 1
+    )
+    s_value = int(severity_id.replace("S", "")) if severity_id.startswith("S") else 1
+
+    return po_value * ph_value * s_value
+
 
 class DHFDataManager:
     """Manages loading and saving of DHF data from YAML files."""
@@ -21,13 +55,18 @@ class DHFDataManager:
 
         self.data_file_path = data_file_path
         self._data = None
+        # Changes whenever the cached data is replaced, so derived output can be reused
+        self.data_version = next(_data_versions)
+        # Views derived from the data, as name -> (data, data_version, view)
+        self._derived = {}
 
     def load_data(self) -> Dict[str, Any]:
         """Load DHF data from YAML file."""
         if self._data is None:
             try:
                 with open(self.data_file_path, "r", encoding="utf-8") as file:
-                    self._data = yaml.safe_load(file)
+                    self._data = yaml.load(file, Loader=SafeLoader)
+                self.data_version = next(_data_versions)
             except FileNotFoundError:
                 raise FileNotFoundError(
                     f"DHF data file not found: {self.data_file_path}"
@@ -41,11 +80,30 @@ class DHFDataManager:
         """Save DHF data to YAML file."""
         try:
             with open(self.data_file_path, "w", encoding="utf-8") as file:
-                yaml.safe_dump(data, file, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    data,
+                    file,
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
             self._data = data  # Update cached data
+            self.data_version = next(_data_versions)
         except Exception as e:
             raise ValueError(f"Failed to save data: {e}")
 
+    def _get_derived(self, name: str, build: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Get a view built from the data, rebuilding it when the data has changed.
+
+        Views are shared between callers, so treat them as read-only.
+        """
+        data = self.load_data()
+        cached = self._derived.get(name)
+        if cached is None or cached[0] is not data or cached[1] != self.data_version:
+            cached = (data, self.data_version, build(data))
+            self._derived[name] = cached
+        return cached[2]
+
     def get_user_needs(self) -> Dict[str, Any]:
         """Get all user needs."""
         data = self.load_data()
@@ -61,7 +119,11 @@ class DHFDataManager:
 
     def get_risks_flat(self) -> Dict[str, Any]:
         """Get all risks in a flat structure for backward compatibility."""
-        data = self.load_data()
+        return self._get_derived("risks_flat", self._flatten_risks)
+
+    @staticmethod
+    def _flatten_risks(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten grouped risks into a single dict keyed by risk ID."""
         risks_data = data.get("risks", {})
 
         # If risks are already in the old flat format, return them
@@ -103,35 +165,27 @@ class DHFDataManager:
         data = self.load_data()
         return data.get("mitigation_links", {})
 
-    def get_item_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
-        """Get any item by its ID across all categories."""
-        data = self.load_data()
-
-        # Search in user needs (handle both flat and nested structures)
-        user_needs_data = data.get("user_needs", {})
-        for group_key, group_data in user_needs_data.items():
+    def _iter_items(self, data: Dict[str, Any]):
+        """Yield (item_id, item) for every linkable item, in lookup order."""
+        # User needs (handle both flat and nested structures)
+        for group_key, group_data in data.get("user_needs", {}).items():
             if isinstance(group_data, dict) and "needs" in group_data:
                 # New nested structure
-                if item_id in group_data["needs"]:
-                    return group_data["needs"][item_id]
+                yield from group_data["needs"].items()
             else:
                 # Legacy flat structure
-                if group_key == item_id:
-                    return group_data
+                yield group_key, group_data
 
-        # Search in risks (handle both grouped and flat structures)
-        risks_data = data.get("risks", {})
-        for group_key, group_data in risks_data.items():
+        # Risks (handle both grouped and flat structures)
+        for group_key, group_data in data.get("risks", {}).items():
             if isinstance(group_data, dict) and "risks" in group_data:
                 # New grouped structure
-                if item_id in group_data["risks"]:
-                    return group_data["risks"][item_id]
+                yield from group_data["risks"].items()
             else:
                 # Legacy flat structure
-                if group_key == item_id:
-                    return group_data
+                yield group_key, group_data
 
-        # Search in product requirements (handle both 2-level and 3-level structures)
+        # Product requirements (handle both 2-level and 3-level structures)
         for group in data.get("product_requirements", {}).values():
             if "requirements" in group:
                 # Check if this is a 3-level structure (nested requirements)
@@ -139,119 +193,51 @@ class DHFDataManager:
                     isinstance(req, dict) and "requirements" in req
                     for req in group["requirements"].values()
                 ):
-                    # 3-level structure: search in nested requirements
+                    # 3-level structure: nested requirements
                     for sub_group in group["requirements"].values():
-                        if (
-                            "requirements" in sub_group
-                            and item_id in sub_group["requirements"]
-                        ):
-                            return sub_group["requirements"][item_id]
+                        if "requirements" in sub_group:
+                            yield from sub_group["requirements"].items()
                 else:
-                    # 2-level structure: search in direct requirements
-                    if item_id in group["requirements"]:
-                        return group["requirements"][item_id]
-
-        # Search in software specifications
-        for group in data.get("software_specifications", {}).values():
-            if "specifications" in group:
-                if item_id in group["specifications"]:
-                    return group["specifications"][item_id]
-
-        # Search in hardware specifications
-        for group in data.get("hardware_specifications", {}).values():
-            if "specifications" in group:
-                if item_id in group["specifications"]:
-                    return group["specifications"][item_id]
+                    # 2-level structure: direct requirements
+                    yield from group["requirements"].items()
+
+        # Software and hardware specifications
+        for section in ("software_specifications", "hardware_specifications"):
+            for group in data.get(section, {}).values():
+                if "specifications" in group:
+                    yield from group["specifications"].items()
+
+    def _build_id_index(self, data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Index every linkable item by its ID."""
+        index = {}
+        for item_id, item in self._iter_items(data):
+            # The first match wins, as it did when each lookup scanned the data
+            index.setdefault(item_id, item)
+        return index
 
-        return None
+    def get_item_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """Get any item by its ID across all categories."""
+        return self._get_derived("id_index", self._build_id_index).get(item_id)
 
     def update_item(self, item_id: str, updated_item: Dict[str, Any]) -> bool:
         """Update an item by its ID."""
-        data = self.load_data()
-
-        # Update in user needs (handle both flat and nested structures)
-        user_needs_data = data.get("user_needs", {})
-        for group_key, group_data in user_needs_data.items():
-            if isinstance(group_data, dict) and "needs" in group_data:
-                # New nested structure
-                if item_id in group_data["needs"]:
-                    data["user_needs"][group_key]["needs"][item_id].update(updated_item)
-                    self.save_data(data)
-                    return True
-            else:
-                # Legacy flat structure
-                if group_key == item_id:
-                    data["user_needs"][group_key].update(updated_item)
-                    self.save_data(data)
-                    return True
+        item = self.get_item_by_id(item_id)
+        if item is None:
+            return False
 
-        # Update in risks (handle both grouped and flat structures)
-        risks_data = data.get("risks", {})
-        for group_key, group_data in risks_data.items():
-            if isinstance(group_data, dict) and "risks" in group_data:
-                # New grouped structure
-                if item_id in group_data["risks"]:
-                    data["risks"][group_key]["risks"][item_id].update(updated_item)
-                    self.save_data(data)
-                    return True
-            else:
-                # Legacy flat structure
-                if group_key == item_id:
-                    data["risks"][group_key].update(updated_item)
-                    self.save_data(data)
-                    return True
-
-        # Update in product requirements (handle both 2-level and 3-level structures)
-        for group_key, group in data.get("product_requirements", {}).items():
-            if "requirements" in group:
-                # Check if this is a 3-level structure (nested requirements)
-                if any(
-                    isinstance(req, dict) and "requirements" in req
-                    for req in group["requirements"].values()
-                ):
-                    # 3-level structure: search in nested requirements
-                    for sub_key, sub_group in group["requirements"].items():
-                        if (
-                            "requirements" in sub_group
-                            and item_id in sub_group["requirements"]
-                        ):
-                            data["product_requirements"][group_key]["requirements"][
-                                sub_key
-                            ]["requirements"][item_id].update(updated_item)
-                            self.save_data(data)
-                            return True
-                else:
-                    # 2-level structure: search in direct requirements
-                    if item_id in group["requirements"]:
-                        data["product_requirements"][group_key]["requirements"][
-                            item_id
-                        ].update(updated_item)
-                        self.save_data(data)
-                        return True
-
-        # Update in software specifications
-        for group_key, group in data.get("software_specifications", {}).items():
-            if "specifications" in group and item_id in group["specifications"]:
-                data["software_specifications"][group_key]["specifications"][
-                    item_id
-                ].update(updated_item)
-                self.save_data(data)
-                return True
-
-        # Update in hardware specifications
-        for group_key, group in data.get("hardware_specifications", {}).items():
-            if "specifications" in group and item_id in group["specifications"]:
-                data["hardware_specifications"][group_key]["specifications"][
-                    item_id
-                ].update(updated_item)
-                self.save_data(data)
-                return True
-
-        return False
+        # Items in the index are the dicts inside the cached data
+        item.update(updated_item)
+        self.save_data(self._data)
+        return True
 
     def get_linkable_items(self) -> Dict[str, List[Dict[str, str]]]:
         """Get all items that can be linked to (for dropdowns)."""
-        data = self.load_data()
+        return self._get_derived("linkable_items", self._collect_linkable_items)
+
+    def _collect_linkable_items(
+        self, data: Dict[str, Any]
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """Collect the ID and title of every item that can be linked to."""
         linkable = {"user_needs": [], "risks": [], "product_requirements": []}
 
         # Add user needs (handle both flat and nested structures)
@@ -319,8 +305,11 @@ class DHFDataManager:
 
     def get_configuration(self) -> Dict[str, Any]:
         """Get configuration settings including dropdown options."""
-        data = self.load_data()
+        return self._get_derived("configuration", self._build_configuration)
 
+    @staticmethod
+    def _build_configuration(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the configuration settings, filling in default mappings."""
         # Get mapping configuration
         config = data.get("configuration", {})
         severity_mapping = config.get("severity_mapping", {})
@@ -544,19 +533,4 @@ class DHFDataManager:
         self, probability_occurrence_id: str, probability_harm_id: str, severity_id: str
     ) -> int:
         """Calculate RBM score: Probability of Occurrence × Probability of Harm × Severity."""
-        # Map IDs to numeric values (1, 2, 3)
-        po_value = (
-            int(probability_occurrence_id.replace("PO", ""))
-            if probability_occurrence_id.startswith("PO")
-            else 1
-        )
-        ph_value = (
-            int(probability_harm_id.replace("PH", ""))
-            if probability_harm_id.startswith("PH")
-            else 1
-        )
-        s_value = (
-            int(severity_id.replace("S", "")) if severity_id.startswith("S") else 1
-        )
-
-        return po_value * ph_value * s_value
+        return _rbm_score(probability_occurrence_id, probability_harm_id, severity_id)
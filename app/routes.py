@@ -3,27 +3,44 @@
 
 """Main routes for the Pocket DHF application."""
 
+import hashlib
 import os
 import re
 import subprocess
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from flask import (
     Blueprint,
     current_app,
     flash,
     jsonify,
+    make_response,
     redirect,
     render_template,
     request,
     url_for,
 )
+from werkzeug.http import is_resource_modified
 
 from app.data_utils import DHFDataManager
 
 main = Blueprint("main", __name__)
 data_manager = None  # Will be initialized in each route
 
+# Report template placeholders, compiled once rather than on every report request
+TEMPLATE_VAR_RE = re.compile(r"\{\{(\w+)\}\}")
+AUTO_CONTENT_RE = re.compile(r"<!-- AUTO_CONTENT: (\w+) -->")
+
+# Generated report tables keyed by (data version, content type)
+AUTO_CONTENT_CACHE = {}
+AUTO_CONTENT_CACHE_SIZE = 64
+
+# Templates the /browse page is rendered from
+BROWSE_TEMPLATES = ("browse.html", "base.html")
+
+# Markdown shown on the validation page
+SPECIFICATIONS_PATH = "docs/specifications.md"
+
 
 def get_data_manager():
     """Get or create the data manager with the configured data file path."""
@@ -90,8 +107,25 @@ def get_git_user_info():
 def browse():
     """Browse DHF data with tree navigation and editing."""
     try:
-        # Load all data for the tree navigation
         data_manager = get_data_manager()
+        user_info = get_git_user_info()
+
+        # The page shows the git user too, so that is part of its version. Saves
+        # can keep the file's mtime and size, but always bump the data version.
+        # Loading bumps it as well, so load first for the key to stay the same.
+        data_manager.load_data()
+        templates_dir = os.path.join(current_app.root_path, current_app.template_folder)
+        etag, last_modified = get_file_validators(
+            f"browse|{data_manager.data_version}"
+            f"|{user_info['name']}|{user_info['email']}",
+            [data_manager.data_file_path]
+            + [os.path.join(templates_dir, name) for name in BROWSE_TEMPLATES],
+        )
+        not_modified = conditional_response(etag, last_modified)
+        if not_modified:
+            return not_modified
+
+        # Load all data for the tree navigation
         user_needs = data_manager.get_user_needs()
         risks = data_manager.get_risks()
         product_requirements = data_manager.get_product_requirements()
@@ -100,7 +134,6 @@ def browse():
         mitigation_links = data_manager.get_mitigation_links()
         linkable_items = data_manager.get_linkable_items()
         config = data_manager.get_configuration()
-        user_info = get_git_user_info()
 
         # Calculate counts for display
         user_needs_count = len(user_needs)
@@ -142,7 +175,7 @@ def browse():
             if "specifications" in group:
                 hardware_specifications_count += len(group["specifications"])
 
-        return render_template(
+        page = render_template(
             "browse.html",
             title="Browse DHF Data",
             user_needs=user_needs,
@@ -160,6 +193,7 @@ def browse():
             software_specifications_count=software_specifications_count,
             hardware_specifications_count=hardware_specifications_count,
         )
+        return set_validators(make_response(page), etag, last_modified)
     except Exception as e:
         flash(f"Error loading DHF data: {str(e)}", "error")
         return redirect(url_for("main.index"))
@@ -209,11 +243,10 @@ def validation():
     """Validation page for system testing and specifications."""
     try:
         # Load specifications content
-        specifications_path = "docs/specifications.md"
         specifications_content = ""
 
-        if os.path.exists(specifications_path):
-            with open(specifications_path, "r", encoding="utf-8") as f:
+        if os.path.exists(SPECIFICATIONS_PATH):
+            with open(SPECIFICATIONS_PATH, "r", encoding="utf-8") as f:
                 specifications_content = f.read()
 
         # Convert markdown to HTML (improved conversion)
@@ -327,9 +360,15 @@ def validation():
 def generate_report(report_name):
     """API endpoint to generate a specific report."""
     try:
+        etag, last_modified = get_report_validators(report_name)
+        # If the client already has this version, skip regenerating it
+        not_modified = conditional_response(etag, last_modified)
+        if not_modified:
+            return not_modified
+
         report_content = generate_report_content(report_name)
         if report_content:
-            return jsonify(report_content)
+            return set_validators(jsonify(report_content), etag, last_modified)
         else:
             return jsonify({"error": "Report not found"}), 404
     except Exception as e:
@@ -833,8 +872,78 @@ def get_report_templates():
     return templates
 
 
+def get_file_validators(key, paths):
+    """Build an ETag and Last-Modified time for output generated from files.
+
+    The ETag changes whenever any of the files is rewritten, so it can be checked
+    without generating the output. Returns (None, None) if a file can't be stat'ed.
+    """
+    try:
+        stats = [os.stat(path) for path in paths]
+    except OSError:
+        return None, None
+
+    parts = [key] + [f"{stat.st_mtime_ns}:{stat.st_size}" for stat in stats]
+    etag = hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+    last_modified = datetime.fromtimestamp(
+        max(stat.st_mtime for stat in stats), timezone.utc
+    )
+    return etag, last_modified
+
+
+def conditional_response(etag, last_modified):
+    """Return a 304 response if the client's copy is current, otherwise None."""
+    if etag is None or is_resource_modified(
+        request.environ, etag=etag, last_modified=last_modified
+    ):
+        return None
+    return set_validators(current_app.response_class(status=304), etag, last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    """Mark a response as cacheable only after revalidating with the server."""
+    if etag:
+        response.set_etag(etag)
+        response.last_modified = last_modified
+        response.cache_control.no_cache = True
+    return response
+
+
+def get_report_validators(report_name):
+    """Build the ETag and Last-Modified time for a report.
+
+    A report depends on its template, the DHF data and the day it is generated
+    on, since it shows the generation and next review dates.
+    """
+    templates_dir = current_app.config.get(
+        "DHF_REPORTS_DIR", "sample-data/report-templates"
+    )
+    template_path = os.path.join(templates_dir, f"{report_name}.md")
+
+    # Saves can keep the data file's mtime and size, but bump the data version.
+    # Loading bumps it as well, so load first for the key to stay the same.
+    data_manager = get_data_manager()
+    data_manager.load_data()
+    today = datetime.now().date()
+    etag, last_modified = get_file_validators(
+        f"{report_name}|{data_manager.data_version}|{today}",
+        [template_path, data_manager.data_file_path],
+    )
+    if last_modified:
+        # A report generated on an earlier day is stale even if no file changed
+        start_of_day = datetime.combine(today, datetime.min.time()).astimezone(
+            timezone.utc
+        )
+        last_modified = max(last_modified, start_of_day)
+    return etag, last_modified
+
+
 def generate_report_content(report_name):
-    """Generate report content by processing template and inserting DHF data."""
+    """Generate report content by processing template and inserting DHF data.
+
+    Returns None if there is no template for the report. Errors reading the
+    template or the data are left to the caller.
+    """
     templates_dir = current_app.config.get(
         "DHF_REPORTS_DIR", "sample-data/report-templates"
     )
@@ -843,66 +952,77 @@ def generate_report_content(report_name):
     if not os.path.exists(template_path):
         return None
 
-    try:
-        # Read template
-        with open(template_path, "r", encoding="utf-8") as f:
-            template_content = f.read()
-
-        # Get project metadata
-        data_manager = get_data_manager()
-        data = data_manager.load_data()
-        metadata = data.get("metadata", {})
-
-        # Replace template variables
-        template_vars = {
-            "generation_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "project_name": metadata.get("project_name", "Unknown Project"),
-            "device_type": metadata.get("device_type", "Unknown Device"),
-            "version": metadata.get("version", "1.0"),
-            "next_review_date": (datetime.now() + timedelta(days=90)).strftime(
-                "%Y-%m-%d"
-            ),
-        }
+    # Read template
+    with open(template_path, "r", encoding="utf-8") as f:
+        template_content = f.read()
 
-        # Add risk-specific variables for risk management report
-        if report_name == "risk_management":
-            risks = data.get("risks", {})
-            total_risks = 0
-            for group in risks.values():
-                if "risks" in group:
-                    total_risks += len(group["risks"])
+    # Get project metadata
+    data_manager = get_data_manager()
+    data = data_manager.load_data()
+    metadata = data.get("metadata", {})
+
+    # Replace template variables
+    template_vars = {
+        "generation_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "project_name": metadata.get("project_name", "Unknown Project"),
+        "device_type": metadata.get("device_type", "Unknown Device"),
+        "version": metadata.get("version", "1.0"),
+        "next_review_date": (datetime.now() + timedelta(days=90)).strftime("%Y-%m-%d"),
+    }
 
-            template_vars.update(
-                {"total_risks": total_risks, "risk_categories": len(risks)}
-            )
+    # Add risk-specific variables for risk management report
+    if report_name == "risk_management":
+        risks = data.get("risks", {})
+        total_risks = 0
+        for group in risks.values():
+            if "risks" in group:
+                total_risks += len(group["risks"])
 
-        # Replace template variables
-        for var, value in template_vars.items():
-            template_content = template_content.replace("{{" + var + "}}", str(value))
+        template_vars.update(
+            {"total_risks": total_risks, "risk_categories": len(risks)}
+        )
 
-        # Process AUTO_CONTENT tags
-        template_content = process_auto_content(template_content, data)
+    # Replace template variables in a single pass, leaving unknown ones as-is
+    template_content = TEMPLATE_VAR_RE.sub(
+        lambda match: str(template_vars.get(match.group(1), match.group(0))),
+        template_content,
+    )
 
-        return {
-            "title": template_vars["project_name"],
-            "content": template_content,
-            "generated_date": template_vars["generation_date"],
-        }
+    # Process AUTO_CONTENT tags
+    template_content = process_auto_content(
+        template_content, data, data_manager.data_version
+    )
 
-    except Exception as e:
-        print(f"Error generating report {report_name}: {e}")
-        return None
+    return {
+        "title": template_vars["project_name"],
+        "content": template_content,
+        "generated_date": template_vars["generation_date"],
+    }
 
 
-def process_auto_content(content, data):
-    """Process AUTO_CONTENT tags and replace with generated tables."""
+def process_auto_content(content, data, data_version=None):
+    """Process AUTO_CONTENT tags and replace with generated tables.
 
-    # Find all AUTO_CONTENT tags
-    auto_content_pattern = r"<!-- AUTO_CONTENT: (\w+) -->"
+    When data_version is given, tables generated for that version of the data
+    are reused across calls.
+    """
 
     def replace_auto_content(match):
         content_type = match.group(1)
-
+        if data_version is None:
+            return generate_auto_content(content_type)
+
+        # Another request may clear the cache at any time, so keep a local copy
+        key = (data_version, content_type)
+        table = AUTO_CONTENT_CACHE.get(key)
+        if table is None:
+            table = generate_auto_content(content_type)
+            if len(AUTO_CONTENT_CACHE) >= AUTO_CONTENT_CACHE_SIZE:
+                AUTO_CONTENT_CACHE.clear()
+            AUTO_CONTENT_CACHE[key] = table
+        return table
+
+    def generate_auto_content(content_type):
         if content_type == "user_needs_table":
             return generate_user_needs_table(data)
         elif content_type == "product_requirements_tables":
@@ -934,7 +1054,7 @@ def process_auto_content(content, data):
         else:
             return f"*[{content_type} content would be generated here]*"
 
-    return re.sub(auto_content_pattern, replace_auto_content, content)
+    return AUTO_CONTENT_RE.sub(replace_auto_content, content)
 
 
 def generate_user_needs_table(data):
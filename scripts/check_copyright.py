@@ -14,7 +14,11 @@ import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, Optional
+
+# HTML titles live in the document head, so only the first few KB are searched
+TITLE_RE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE)
+TITLE_SEARCH_WINDOW = 8192
 
 
 class CopyrightChecker:
@@ -59,6 +63,13 @@ class CopyrightChecker:
         },
     }
 
+    # Reverse lookup from file extension to file type
+    _SUFFIX_TO_TYPE = {
+        ext: file_type
+        for file_type, config in COPYRIGHT_PATTERNS.items()
+        for ext in config["extensions"]
+    }
+
     def __init__(self, fix_mode: bool = False, year: Optional[int] = None):
         """Initialize the copyright checker.
 
@@ -69,14 +80,11 @@ class CopyrightChecker:
         self.fix_mode = fix_mode
         self.year = year or datetime.now().year
         self.errors = []
+        self.files_checked = 0
 
     def get_file_type(self, file_path: Path) -> Optional[str]:
         """Determine the file type based on extension."""
-        suffix = file_path.suffix.lower()
-        for file_type, config in self.COPYRIGHT_PATTERNS.items():
-            if suffix in config["extensions"]:
-                return file_type
-        return None
+        return self._SUFFIX_TO_TYPE.get(file_path.suffix.lower())
 
     def has_copyright(self, content: str, file_type: str) -> bool:
         """Check if content has a copyright header."""
@@ -108,7 +116,7 @@ class CopyrightChecker:
 
         elif file_type == "html":
             # Look for title or create generic description
-            title_match = re.search(r"<title>(.*?)</title>", content, re.IGNORECASE)
+            title_match = TITLE_RE.search(content, 0, TITLE_SEARCH_WINDOW)
             if title_match:
                 return title_match.group(1).strip()
             return "HTML document"
@@ -235,7 +243,7 @@ class CopyrightChecker:
             self.errors.append(f"Missing copyright header: {file_path}")
             return False
 
-    def check_files(self, file_paths: List[Path]) -> bool:
+    def check_files(self, file_paths: Iterable[Path]) -> bool:
         """Check multiple files for copyright headers.
 
         Returns:
@@ -244,12 +252,19 @@ class CopyrightChecker:
         """
         all_good = True
         for file_path in file_paths:
+            self.files_checked += 1
             if not self.check_file(file_path):
                 all_good = False
 
         return all_good
 
 
+def iter_source_files(project_root: Path) -> Iterator[Path]:
+    """Yield source files under the project root, one glob pattern at a time."""
+    for pattern in ("**/*.py", "**/*.html", "**/*.yml", "**/*.yaml"):
+        yield from project_root.glob(pattern)
+
+
 def main():
     """Main entry point for the copyright checker."""
     parser = argparse.ArgumentParser(
@@ -275,45 +290,47 @@ def main():
     else:
         # Find all source files in the project
         project_root = Path(__file__).parent.parent
-        file_paths = []
-        for pattern in ["**/*.py", "**/*.html", "**/*.yml", "**/*.yaml"]:
-            file_paths.extend(project_root.glob(pattern))
+        root_depth = len(project_root.parts)
 
         # Filter out unwanted directories
-        exclude_patterns = [
-            "__pycache__",
-            ".git",
-            ".pytest_cache",
-            "build",
-            "dist",
-            ".venv",
-            "venv",
-            "node_modules",
-            "htmlcov",
-            ".coverage",
-        ]
-
-        file_paths = [
-            f
-            for f in file_paths
-            if not any(exclude in str(f) for exclude in exclude_patterns)
-        ]
+        exclude_dirs = frozenset(
+            [
+                "__pycache__",
+                ".git",
+                ".github",
+                ".pytest_cache",
+                "build",
+                "dist",
+                ".venv",
+                "venv",
+                "node_modules",
+                "htmlcov",
+                ".coverage",
+            ]
+        )
 
-    if not file_paths:
-        print("No files to check")
-        return 0
+        # Files are filtered and checked as the glob discovers them
+        file_paths = (
+            f
+            for f in iter_source_files(project_root)
+            if exclude_dirs.isdisjoint(f.parts[root_depth:])
+        )
 
     # Check files
     checker = CopyrightChecker(fix_mode=args.fix, year=args.year)
     success = checker.check_files(file_paths)
 
+    if not checker.files_checked:
+        print("No files to check")
+        return 0
+
     # Report results
     if checker.errors:
         for error in checker.errors:
             print(f"❌ {error}")
 
     if success:
-        print(f"✅ All {len(file_paths)} files have proper copyright headers")
+        print(f"✅ All {checker.files_checked} files have proper copyright headers")
         return 0
     else:
         print(
@@ -10,10 +10,14 @@ Licensed under the MIT License. See LICENSE file in the project root.
 
 import argparse
 import ast
+import re
 import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+# Cheap pre-check so files without any class definition skip the AST walk
+CLASS_DEF_RE = re.compile(r"^[ \t]*class\s", re.MULTILINE)
+
 
 class DocstringChecker:
     """Checks for missing docstrings in Python classes."""
@@ -27,14 +31,11 @@ class DocstringChecker:
         self.fix_mode = fix_mode
         self.errors = []
 
-    def get_class_info(
-        self, node: ast.ClassDef, source_lines: List[str]
-    ) -> Tuple[str, int, Optional[str]]:
+    def get_class_info(self, node: ast.ClassDef) -> Tuple[str, int, Optional[str]]:
         """Extract information about a class definition.
 
         Args:
             node: AST node representing the class
-            source_lines: Source code lines
 
         Returns:
             Tuple of (class_name, line_number, existing_docstring)
@@ -136,25 +137,26 @@ class DocstringChecker:
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
-                source_lines = content.splitlines()
         except Exception as e:
             self.errors.append(f"Error reading {file_path}: {e}")
             return False
 
+        # Parse every file, so syntax errors are reported even without classes
         try:
             tree = ast.parse(content, filename=str(file_path))
         except SyntaxError as e:
             self.errors.append(f"Syntax error in {file_path}: {e}")
             return False
 
+        if not CLASS_DEF_RE.search(content):
+            return True
+
         # Find all class definitions
         classes_without_docstrings = []
 
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
-                class_name, line_number, docstring = self.get_class_info(
-                    node, source_lines
-                )
+                class_name, line_number, docstring = self.get_class_info(node)
 
                 if not docstring or not docstring.strip():
                     classes_without_docstrings.append((class_name, line_number))
@@ -224,25 +226,26 @@ def main():
     else:
         # Find all Python files in the project
         project_root = Path(__file__).parent.parent
+        root_depth = len(project_root.parts)
         file_paths = list(project_root.glob("**/*.py"))
 
         # Filter out unwanted directories
-        exclude_patterns = [
-            "__pycache__",
-            ".git",
-            ".pytest_cache",
-            "build",
-            "dist",
-            ".venv",
-            "venv",
-            "node_modules",
-            "htmlcov",
-        ]
+        exclude_dirs = frozenset(
+            [
+                "__pycache__",
+                ".git",
+                ".pytest_cache",
+                "build",
+                "dist",
+                ".venv",
+                "venv",
+                "node_modules",
+                "htmlcov",
+            ]
+        )
 
         file_paths = [
-            f
-            for f in file_paths
-            if not any(exclude in str(f) for exclude in exclude_patterns)
+            f for f in file_paths if exclude_dirs.isdisjoint(f.parts[root_depth:])
         ]
 
     if not file_paths:
@@ -3,50 +3,166 @@
 
 """Pytest configuration and fixtures for Pocket DHF tests."""
 
+import copy
+import itertools
 import os
-import tempfile
+import subprocess
+from html.parser import HTMLParser
+from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
+import yaml
 
 from app import create_app
-from app.data_utils import DHFDataManager
+from app.data_utils import DHFDataManager, SafeDumper
 
 
-@pytest.fixture
-def app(sample_dhf_data):
-    """Create and configure a new app instance for each test."""
-    # Create a temporary file for testing
-    db_fd, db_path = tempfile.mkstemp()
-
-    # Write sample data to the temporary file
-    import yaml
+@pytest.fixture(scope="session")
+def _cached_yaml_bytes(sample_dhf_data_session):
+    """Sample DHF data serialized to YAML once per session."""
+    return yaml.dump(sample_dhf_data_session, Dumper=SafeDumper).encode("utf-8")
 
-    with open(db_path, "w") as f:
-        yaml.dump(sample_dhf_data, f)
 
-    app = create_app(data_file_path=db_path)
+def _make_app(db_path):
+    """Create an app configured for testing against the given data file."""
+    app = create_app(data_file_path=str(db_path))
     app.config.update(
         {
             "TESTING": True,
             "SECRET_KEY": "test-secret-key",
             "DEBUG": False,
+            # Let static assets be cached and revalidated like in a browser
+            "SEND_FILE_MAX_AGE_DEFAULT": 3600,
+            "TEMPLATES_AUTO_RELOAD": False,
         }
     )
 
     # Override the data file path for testing
-    app.config["DHF_DATA_FILE"] = db_path
+    app.config["DHF_DATA_FILE"] = str(db_path)
+
+    return app
+
+
+def _in_memory_manager(data_file, data):
+    """A data manager over data_file whose cache is seeded with a copy of data.
+
+    Copying the dict is far cheaper than parsing the YAML again. Loading up
+    front also means tests that patch open() only affect what they target.
+    """
+    manager = DHFDataManager(str(data_file))
+    manager._data = copy.deepcopy(data)
+    return manager
+
 
-    yield app
+@pytest.fixture(scope="session")
+def app(tmp_path_factory, _cached_yaml_bytes, sample_dhf_data_session):
+    """Create and configure the app once per session."""
+    # Tests that write through the API request data_manager, which resets this file
+    db_path = tmp_path_factory.mktemp("app") / "dhf.yaml"
+    db_path.write_bytes(_cached_yaml_bytes)
 
-    # Clean up
-    os.close(db_fd)
-    os.unlink(db_path)
+    # Routes that are not given a data manager read the session data from memory
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "app.routes.data_manager",
+            _in_memory_manager(db_path, sample_dhf_data_session),
+        )
+        yield _make_app(db_path)
 
 
 @pytest.fixture
+def fresh_client(tmp_path, monkeypatch, _cached_yaml_bytes):
+    """A test client for a new app whose data manager has not loaded any data."""
+    db_path = tmp_path / "dhf.yaml"
+    db_path.write_bytes(_cached_yaml_bytes)
+    # Let the routes create their own manager, as they do in a new process
+    monkeypatch.setattr("app.routes.data_manager", None)
+    return _make_app(db_path).test_client()
+
+
+@pytest.fixture(scope="session")
 def client(app):
-    """A test client for the app."""
-    return app.test_client()
+    """A test client for the app.
+
+    The tests are stateless, so the client keeps no cookie jar, and every page
+    template is compiled up front rather than on its first request.
+    """
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+    return app.test_client(use_cookies=False)
+
+
+@pytest.fixture(scope="session")
+def get_page(client):
+    """Fetch a URL once per session and hand out the same response after that.
+
+    Only for read-only checks; tests that patch the app must use the client.
+    """
+    responses = {}
+
+    def get(path):
+        if path not in responses:
+            responses[path] = client.get(path)
+        return responses[path]
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def browse_page(get_page):
+    """The rendered /browse page as bytes, fetched once per session."""
+    response = get_page("/browse")
+    assert response.status_code == 200
+    return response.data
+
+
+@pytest.fixture(scope="session")
+def browse_html(browse_page):
+    """The rendered /browse page as text."""
+    return browse_page.decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def browse_missing(browse_html):
+    """Function that returns the needles missing from the /browse page.
+
+    A needle is a string, or a tuple of alternatives of which any one will do.
+    Lowercase needles listed in any_case are matched regardless of case.
+    """
+    lowered = browse_html.lower()
+
+    def found(needle, any_case):
+        if isinstance(needle, tuple):
+            return any(found(alternative, any_case) for alternative in needle)
+        return needle in (lowered if needle in any_case else browse_html)
+
+    def missing(needles, any_case=frozenset()):
+        return [needle for needle in needles if not found(needle, any_case)]
+
+    return missing
+
+
+class _ElementIdCollector(HTMLParser):
+    """Collects the id attribute of every element in an HTML document."""
+
+    def __init__(self):
+        super().__init__()
+        self.ids = set()
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name == "id" and value:
+                self.ids.add(value)
+
+
+@pytest.fixture(scope="session")
+def browse_element_ids(browse_html):
+    """Ids of the elements on the /browse page, parsed once per session."""
+    collector = _ElementIdCollector()
+    collector.feed(browse_html)
+    collector.close()
+    return frozenset(collector.ids)
 
 
 @pytest.fixture
@@ -55,9 +171,9 @@ def runner(app):
     return app.test_cli_runner()
 
 
-@pytest.fixture
-def sample_dhf_data():
-    """Sample DHF data for testing."""
+@pytest.fixture(scope="session")
+def sample_dhf_data_session():
+    """Sample DHF data built once per session; treat as read-only."""
     return {
         "metadata": {
             "project_name": "Test Diabetes Monitor",
@@ -171,20 +287,104 @@ def sample_dhf_data():
 
 
 @pytest.fixture
-def data_manager(sample_dhf_data, tmp_path):
-    """Create a data manager with sample data."""
-    data_file = tmp_path / "test_dhf_data.yaml"
+def sample_dhf_data(sample_dhf_data_session):
+    """Sample DHF data for testing (a fresh copy each test may mutate)."""
+    return copy.deepcopy(sample_dhf_data_session)
+
+
+@pytest.fixture
+def data_manager(app, monkeypatch, _cached_yaml_bytes, sample_dhf_data_session):
+    """A data manager over the app's data file, restored after each test.
 
-    # Write sample data to temporary file
-    import yaml
+    Its data is seeded in memory rather than loaded from the file, so it is
+    for route tests; tests of the loading path need a manager of their own.
+    """
+    data_file = Path(app.config["DHF_DATA_FILE"])
+    manager = _in_memory_manager(data_file, sample_dhf_data_session)
+    seeded_version = manager.data_version
 
-    with open(data_file, "w") as f:
-        yaml.dump(sample_dhf_data, f)
+    # Routes pick up this manager, so API writes land in it for this test only
+    monkeypatch.setattr("app.routes.data_manager", manager)
+    yield manager
 
-    return DHFDataManager(str(data_file))
+    # Saving bumps the version, so tests that only read never touch the file
+    if manager.data_version != seeded_version:
+        data_file.write_bytes(_cached_yaml_bytes)
 
 
 @pytest.fixture
+def save_in_place(data_manager):
+    """Save the data manager's data without changing the data file's stat.
+
+    This mimics a same-size rewrite within one mtime tick, as on filesystems
+    with coarse timestamps.
+    """
+    path = data_manager.data_file_path
+    data_manager.save_data(data_manager.load_data())
+    stat = os.stat(path)
+
+    def save():
+        data_manager.save_data(data_manager.load_data())
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert os.stat(path).st_size == stat.st_size
+
+    return save
+
+
+# Data versions for stub managers; negative so they never match a real manager's
+_stub_data_versions = itertools.count(-1, -1)
+
+
+def _returning(value):
+    """A stub method that ignores its arguments and returns value."""
+    return lambda *args, **kwargs: value
+
+
+@pytest.fixture
+def patched_data_manager(app, monkeypatch):
+    """Factory that makes the routes serve the given payload from load_data().
+
+    Extra keyword arguments become stub methods returning the given values.
+    """
+
+    def make(payload, **return_values):
+        manager = SimpleNamespace(
+            data_file_path=app.config["DHF_DATA_FILE"],
+            data_version=next(_stub_data_versions),
+            load_data=_returning(payload),
+            **{name: _returning(value) for name, value in return_values.items()},
+        )
+        monkeypatch.setattr("app.routes.get_data_manager", lambda: manager)
+        return manager
+
+    return make
+
+
+@pytest.fixture(scope="session")
 def mock_git_config():
     """Mock git configuration for testing."""
     return {"name": "Test User", "email": "test@example.com"}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_subprocess_run(mock_git_config):
+    """Keep the routes from running git or the test suite for real.
+
+    `git config` lookups get the mock config, and a test-suite run reports
+    success with no output. Tests that care about the result patch it again.
+    """
+    real_run = subprocess.run
+
+    def run(args, *popenargs, **kwargs):
+        if list(args[:2]) == ["git", "config"]:
+            key = args[-1].split(".")[-1]
+            return SimpleNamespace(
+                returncode=0, stdout=mock_git_config.get(key, "") + "\n"
+            )
+        if "pytest" in args:
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
+        return real_run(args, *popenargs, **kwargs)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.routes.subprocess.run", run)
+        yield
@@ -4,10 +4,55 @@
 """Integration tests for API endpoints."""
 
 import json
-from unittest.mock import patch
 
 import pytest
 
+# Request bodies are encoded once at import time rather than in every test
+UPDATE_ITEM_BODY = json.dumps(
+    {"title": "Updated Title", "description": "Updated Description"}
+)
+UPDATE_MISSING_ITEM_BODY = json.dumps({"title": "Updated Title"})
+UPDATE_FOLDER_NAME_BODY = json.dumps(
+    {
+        "group_type": "risks",
+        "group_key": "Patient Safety",
+        "new_name": "Updated Safety",
+    }
+)
+UPDATE_FOLDER_NAME_MISSING_PARAMS_BODY = json.dumps({"group_type": "risks"})
+UPDATE_MITIGATION_LINK_BODY = json.dumps(
+    {"link_id": "ML001", "effect": "Reduces probability of occurrence by 2"}
+)
+UPDATE_MITIGATION_LINK_MISSING_PARAMS_BODY = json.dumps({"link_id": "ML001"})
+ADD_CONFIG_OPTION_BODY = json.dumps(
+    {
+        "config_type": "severity",
+        "action": "add",
+        "name": "Critical",
+        "description": "Critical impact",
+    }
+)
+ADD_TEST_CONFIG_OPTION_BODY = json.dumps(
+    {
+        "config_type": "severity",
+        "action": "add",
+        "name": "Test",
+        "description": "Test option",
+    }
+)
+UPDATE_CONFIG_OPTION_BODY = json.dumps(
+    {
+        "config_type": "severity",
+        "action": "update",
+        "option_id": "S1",
+        "name": "Updated Low",
+        "description": "Updated description",
+    }
+)
+INVALID_CONFIG_ACTION_BODY = json.dumps(
+    {"config_type": "severity", "action": "invalid_action"}
+)
+
 
 class TestAPIEndpoints:
     """Test cases for API endpoints."""
@@ -17,9 +62,9 @@ class TestAPIEndpoints:
         """Test health check endpoint."""
         response = client.get("/health")
         assert response.status_code == 200
-        data = response.get_json()
-        assert data["status"] == "healthy"
-        assert data["service"] == "pocket-dhf"
+        # Fixed, compact JSON bodies are checked without decoding them
+        assert b'"status":"healthy"' in response.data
+        assert b'"service":"pocket-dhf"' in response.data
 
     @pytest.mark.api
     def test_get_item_endpoint_success(self, client, data_manager):
@@ -37,33 +82,25 @@ class TestAPIEndpoints:
         """Test getting non-existent item by ID."""
         response = client.get("/api/item/NONEXISTENT")
         assert response.status_code == 404
-
-        data = response.get_json()
-        assert "error" in data
+        assert b'"error":' in response.data
 
     @pytest.mark.api
     def test_update_item_endpoint_success(self, client, data_manager):
         """Test updating item successfully."""
-        updated_data = {"title": "Updated Title", "description": "Updated Description"}
-
         response = client.put(
             "/api/item/UN001",
-            data=json.dumps(updated_data),
+            data=UPDATE_ITEM_BODY,
             content_type="application/json",
         )
         assert response.status_code == 200
-
-        data = response.get_json()
-        assert data["success"] is True
+        assert b'"success":true' in response.data
 
     @pytest.mark.api
     def test_update_item_endpoint_not_found(self, client):
         """Test updating non-existent item."""
-        updated_data = {"title": "Updated Title"}
-
         response = client.put(
             "/api/item/NONEXISTENT",
-            data=json.dumps(updated_data),
+            data=UPDATE_MISSING_ITEM_BODY,
             content_type="application/json",
         )
         assert response.status_code == 404
@@ -71,14 +108,10 @@ class TestAPIEndpoints:
     @pytest.mark.api
     def test_update_folder_name_endpoint_success(self, client, data_manager):
         """Test updating folder name successfully."""
-        data = {
-            "group_type": "risks",
-            "group_key": "Patient Safety",
-            "new_name": "Updated Safety",
-        }
-
         response = client.put(
-            "/api/folder-name", data=json.dumps(data), content_type="application/json"
+            "/api/folder-name",
+            data=UPDATE_FOLDER_NAME_BODY,
+            content_type="application/json",
         )
         # This might fail if the folder doesn't exist in the actual data
         # Just check that we get a response
@@ -87,36 +120,32 @@ class TestAPIEndpoints:
     @pytest.mark.api
     def test_update_folder_name_endpoint_missing_params(self, client):
         """Test updating folder name with missing parameters."""
-        data = {"group_type": "risks"}  # Missing group_key and new_name
-
+        # Missing group_key and new_name
         response = client.put(
-            "/api/folder-name", data=json.dumps(data), content_type="application/json"
+            "/api/folder-name",
+            data=UPDATE_FOLDER_NAME_MISSING_PARAMS_BODY,
+            content_type="application/json",
         )
         assert response.status_code == 400
 
     @pytest.mark.api
     def test_update_mitigation_link_endpoint_success(self, client, data_manager):
         """Test updating mitigation link successfully."""
-        data = {"link_id": "ML001", "effect": "Reduces probability of occurrence by 2"}
-
         response = client.put(
             "/api/mitigation-link",
-            data=json.dumps(data),
+            data=UPDATE_MITIGATION_LINK_BODY,
             content_type="application/json",
         )
         assert response.status_code == 200
-
-        result = response.get_json()
-        assert result["success"] is True
+        assert b'"success":true' in response.data
 
     @pytest.mark.api
     def test_update_mitigation_link_endpoint_missing_params(self, client):
         """Test updating mitigation link with missing parameters."""
-        data = {"link_id": "ML001"}  # Missing effect
-
+        # Missing effect
         response = client.put(
             "/api/mitigation-link",
-            data=json.dumps(data),
+            data=UPDATE_MITIGATION_LINK_MISSING_PARAMS_BODY,
             content_type="application/json",
         )
         assert response.status_code == 400
@@ -124,35 +153,22 @@ class TestAPIEndpoints:
     @pytest.mark.api
     def test_update_configuration_add_option(self, client, data_manager):
         """Test adding configuration option."""
-        data = {
-            "config_type": "severity",
-            "action": "add",
-            "name": "Critical",
-            "description": "Critical impact",
-        }
-
         response = client.put(
-            "/api/configuration", data=json.dumps(data), content_type="application/json"
+            "/api/configuration",
+            data=ADD_CONFIG_OPTION_BODY,
+            content_type="application/json",
         )
         assert response.status_code == 200
-
-        result = response.get_json()
-        assert result["success"] is True
-        assert "new_id" in result
+        assert b'"success":true' in response.data
+        assert b'"new_id":' in response.data
 
     @pytest.mark.api
     def test_update_configuration_remove_option(self, client, data_manager):
         """Test removing configuration option."""
         # First add an option
-        add_data = {
-            "config_type": "severity",
-            "action": "add",
-            "name": "Test",
-            "description": "Test option",
-        }
         add_response = client.put(
             "/api/configuration",
-            data=json.dumps(add_data),
+            data=ADD_TEST_CONFIG_OPTION_BODY,
             content_type="application/json",
         )
         new_id = add_response.get_json()["new_id"]
@@ -170,36 +186,26 @@ class TestAPIEndpoints:
             content_type="application/json",
         )
         assert response.status_code == 200
-
-        result = response.get_json()
-        assert result["success"] is True
+        assert b'"success":true' in response.data
 
     @pytest.mark.api
     def test_update_configuration_update_option(self, client, data_manager):
         """Test updating configuration option."""
-        data = {
-            "config_type": "severity",
-            "action": "update",
-            "option_id": "S1",
-            "name": "Updated Low",
-            "description": "Updated description",
-        }
-
         response = client.put(
-            "/api/configuration", data=json.dumps(data), content_type="application/json"
+            "/api/configuration",
+            data=UPDATE_CONFIG_OPTION_BODY,
+            content_type="application/json",
         )
         assert response.status_code == 200
-
-        result = response.get_json()
-        assert result["success"] is True
+        assert b'"success":true' in response.data
 
     @pytest.mark.api
     def test_update_configuration_invalid_action(self, client):
         """Test configuration update with invalid action."""
-        data = {"config_type": "severity", "action": "invalid_action"}
-
         response = client.put(
-            "/api/configuration", data=json.dumps(data), content_type="application/json"
+            "/api/configuration",
+            data=INVALID_CONFIG_ACTION_BODY,
+            content_type="application/json",
         )
         assert response.status_code == 400
 
@@ -221,24 +227,21 @@ class TestAPIEndpoints:
         assert response.status_code == 404
 
     @pytest.mark.api
-    @patch("app.routes.subprocess.run")
-    def test_get_git_user_info_success(self, mock_run, client):
+    def test_get_git_user_info_success(self, get_page, mock_git_config):
         """Test getting git user info successfully."""
-        # Mock subprocess calls
-        mock_run.side_effect = [
-            type("MockResult", (), {"returncode": 0, "stdout": "Test User\n"}),
-            type("MockResult", (), {"returncode": 0, "stdout": "test@example.com\n"}),
-        ]
-
-        response = client.get("/")
+        response = get_page("/")
         assert response.status_code == 200
+        assert mock_git_config["name"].encode() in response.data
 
     @pytest.mark.api
-    @patch("app.routes.subprocess.run")
-    def test_get_git_user_info_failure(self, mock_run, client):
+    def test_get_git_user_info_failure(self, client, monkeypatch):
         """Test getting git user info when git is not available."""
-        # Mock subprocess calls to fail
-        mock_run.side_effect = FileNotFoundError()
+
+        def git_not_found(*args, **kwargs):
+            raise FileNotFoundError()
+
+        monkeypatch.setattr("app.routes.subprocess.run", git_not_found)
 
         response = client.get("/")
         assert response.status_code == 200
+        assert b"Unknown User" in response.data
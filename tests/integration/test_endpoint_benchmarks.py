@@ -0,0 +1,28 @@
+# Copyright (c) 2025 Stratoware LLC
+# Licensed under the MIT License. See LICENSE file in the project root.
+
+"""Latency benchmarks for the hot endpoints.
+
+Benchmarks are disabled by default (see addopts), so a normal run executes each
+request once as a smoke test. Run ``make benchmark`` to time them.
+"""
+
+import pytest
+
+HOT_ENDPOINTS = [
+    "/health",
+    "/api/item/UN001",
+    "/api/report/specifications",
+    "/browse",
+]
+
+
+@pytest.mark.benchmark(group="endpoints")
+class TestEndpointBenchmarks:
+    """Benchmark read-only requests against the shared test client."""
+
+    @pytest.mark.parametrize("path", HOT_ENDPOINTS)
+    def test_endpoint_latency(self, benchmark, client, path):
+        """Time a GET request to a frequently used endpoint."""
+        response = benchmark(client.get, path)
+        assert response.status_code == 200
@@ -3,18 +3,71 @@
 
 """Integration tests for report generation endpoints."""
 
-from unittest.mock import MagicMock, mock_open, patch
+import copy
+from datetime import datetime, timedelta
+from unittest.mock import mock_open, patch
 
 import pytest
 
+REPORT_NAMES = ("requirements_and_needs", "specifications", "risk_management")
+
+
+@pytest.fixture(scope="module")
+def reports(client):
+    """Unmocked responses for each report, generated once per module."""
+    return {name: client.get(f"/api/report/{name}") for name in REPORT_NAMES}
+
+
+def _frozen_datetime(now):
+    """A datetime class whose now() always returns the given time."""
+
+    class FrozenDatetime(datetime):
+        """datetime with a fixed current time."""
+
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    return FrozenDatetime
+
+
+@pytest.fixture
+def fake_template(monkeypatch):
+    """Factory that makes every template lookup find and read the given content."""
+
+    def install(content):
+        monkeypatch.setattr("os.path.exists", lambda path: True)
+        monkeypatch.setattr("builtins.open", mock_open(read_data=content))
+
+    return install
+
+
+# Data returned by the patched data manager in TestReportDataStructures; each
+# test gets its own deep copy, so the route cannot change them between runs
+FLAT_PAYLOAD = {
+    "metadata": {"project_name": "Test", "device_type": "Device"},
+    "user_needs": {"UN001": {"title": "Need 1"}},
+    "product_requirements": {},
+}
+HIERARCHICAL_PAYLOAD = {
+    "metadata": {"project_name": "Test", "device_type": "Device"},
+    "user_needs": {"group1": {"user_needs": {"UN001": {"title": "Need 1"}}}},
+    "product_requirements": {"group1": {"requirements": {"PR001": {"title": "Req 1"}}}},
+}
+EMPTY_PAYLOAD = {
+    "metadata": {},
+    "user_needs": {},
+    "product_requirements": {},
+}
+
 
 class TestReportGeneration:
     """Test cases for report generation endpoints."""
 
     @pytest.mark.integration
-    def test_generate_requirements_report(self, client, data_manager):
+    def test_generate_requirements_report(self, reports):
         """Test generating requirements and needs report."""
-        response = client.get("/api/report/requirements_and_needs")
+        response = reports["requirements_and_needs"]
         assert response.status_code == 200
         # Reports return JSON with markdown content
         assert (
@@ -23,9 +76,9 @@ class TestReportGeneration:
         )
 
     @pytest.mark.integration
-    def test_generate_specifications_report(self, client, data_manager):
+    def test_generate_specifications_report(self, reports):
         """Test generating specifications report."""
-        response = client.get("/api/report/specifications")
+        response = reports["specifications"]
         assert response.status_code == 200
         # Reports return JSON with markdown content
         assert (
@@ -34,9 +87,9 @@ class TestReportGeneration:
         )
 
     @pytest.mark.integration
-    def test_generate_risk_management_report(self, client, data_manager):
+    def test_generate_risk_management_report(self, reports):
         """Test generating risk management report."""
-        response = client.get("/api/report/risk_management")
+        response = reports["risk_management"]
         assert response.status_code == 200
         # Reports return JSON with markdown content
         assert (
@@ -51,7 +104,7 @@ class TestReportGeneration:
         assert response.status_code == 404
 
     @pytest.mark.integration
-    def test_generate_report_with_template(self, client, data_manager):
+    def test_generate_report_with_template(self, client, data_manager, fake_template):
         """Test report generation with custom template."""
         template_content = """# Test Report
 ## User Needs
@@ -59,52 +112,54 @@ class TestReportGeneration:
 ## Traceability
 {{traceability_matrix}}
 """
-        with patch("os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=template_content)):
-                response = client.get("/api/report/requirements_and_needs")
-                assert response.status_code == 200
+        fake_template(template_content)
+        response = client.get("/api/report/requirements_and_needs")
+        assert response.status_code == 200
 
     @pytest.mark.integration
     def test_generate_report_without_template(self, client, data_manager):
         """Test report generation without template file."""
         with patch("os.path.exists", return_value=False):
             response = client.get("/api/report/requirements_and_needs")
-            # Should return error or default content
-            assert response.status_code in [200, 404, 500]
+            # A missing template means there is no such report
+            assert response.status_code == 404
 
     @pytest.mark.integration
     def test_generate_report_error_handling(self, client, data_manager):
         """Test report generation error handling."""
-        with patch("app.routes.get_data_manager", side_effect=Exception("Test error")):
+        with patch.object(
+            data_manager, "load_data", side_effect=ValueError("Test error")
+        ):
             response = client.get("/api/report/requirements_and_needs")
-            # May return 404, 500, or 200 depending on error handling
-            assert response.status_code in [404, 500, 200]
+            # Errors loading the data are reported as a JSON 500, not a 404
+            assert response.status_code == 500
+            assert response.get_json() == {"error": "Test error"}
 
 
 class TestReportHelperFunctions:
     """Test cases for report helper functions."""
 
     @pytest.mark.integration
-    def test_generate_user_needs_table(self, client, data_manager):
+    def test_generate_user_needs_table(self, reports):
         """Test user needs table generation."""
         # This gets called as part of report generation
-        response = client.get("/api/report/requirements_and_needs")
+        response = reports["requirements_and_needs"]
         assert response.status_code == 200
         # Check that response contains table-like content
         assert b"|" in response.data or b"None" in response.data
 
     @pytest.mark.integration
-    def test_generate_traceability_matrix(self, client, data_manager):
+    def test_generate_traceability_matrix(self, reports):
         """Test traceability matrix generation."""
-        response = client.get("/api/report/requirements_and_needs")
+        response = reports["requirements_and_needs"]
         assert response.status_code == 200
         # Matrix should be generated
         assert response.data
 
     @pytest.mark.integration
-    def test_generate_performance_summary(self, client, data_manager):
+    def test_generate_performance_summary(self, reports):
         """Test performance summary generation."""
-        response = client.get("/api/report/specifications")
+        response = reports["specifications"]
         assert response.status_code == 200
         # Should generate some content
         assert response.data
@@ -114,7 +169,7 @@ class TestReportTemplates:
     """Test cases for report templates."""
 
     @pytest.mark.integration
-    def test_report_with_all_placeholders(self, client, data_manager):
+    def test_report_with_all_placeholders(self, client, data_manager, fake_template):
         """Test report generation with all template placeholders."""
         template_content = """# Complete Report
 ## Metadata
@@ -131,24 +186,23 @@ class TestReportTemplates:
 {{traceability_matrix}}
 {{performance_summary}}
 """
-        with patch("os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=template_content)):
-                response = client.get("/api/report/requirements_and_needs")
-                assert response.status_code == 200
-                # Should have replaced placeholders
-                assert b"{{" not in response.data or response.status_code == 200
+        fake_template(template_content)
+        response = client.get("/api/report/requirements_and_needs")
+        assert response.status_code == 200
+        # Should have replaced placeholders
+        assert b"{{" not in response.data or response.status_code == 200
 
     @pytest.mark.integration
-    def test_report_with_nested_requirements(self, client, data_manager):
+    def test_report_with_nested_requirements(self, reports):
         """Test report generation with nested requirement structure."""
         # The test data should handle nested requirements
-        response = client.get("/api/report/specifications")
+        response = reports["specifications"]
         assert response.status_code == 200
 
     @pytest.mark.integration
-    def test_report_with_linked_risks(self, client, data_manager):
+    def test_report_with_linked_risks(self, reports):
         """Test report generation with linked risks."""
-        response = client.get("/api/report/risk_management")
+        response = reports["risk_management"]
         assert response.status_code == 200
         # Should include risk information
         assert response.data
@@ -158,9 +212,9 @@ class TestReportDownload:
     """Test cases for report download functionality."""
 
     @pytest.mark.integration
-    def test_download_report_as_markdown(self, client, data_manager):
+    def test_download_report_as_markdown(self, reports):
         """Test downloading report as markdown."""
-        response = client.get("/api/report/requirements_and_needs")
+        response = reports["requirements_and_needs"]
         assert response.status_code == 200
         # Accept either JSON or markdown content type
         assert (
@@ -171,65 +225,91 @@ class TestReportDownload:
         assert response.data
 
     @pytest.mark.integration
-    def test_download_multiple_reports(self, client, data_manager):
-        """Test downloading multiple different reports."""
-        reports = ["requirements_and_needs", "specifications", "risk_management"]
-        for report_name in reports:
-            response = client.get(f"/api/report/{report_name}")
-            assert response.status_code == 200
-            assert response.data  # Should have content
+    def test_download_report_not_modified(self, client):
+        """Test that a report matching If-None-Match returns 304."""
+        etag = client.get("/api/report/requirements_and_needs").headers["ETag"]
+
+        response = client.get(
+            "/api/report/requirements_and_needs", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert not response.data
 
+    @pytest.mark.integration
+    def test_download_report_not_modified_fresh_app(self, fresh_client):
+        """Test that the first ETag a new app hands out for a report validates."""
+        etag = fresh_client.get("/api/report/specifications").headers["ETag"]
 
-class TestReportDataStructures:
-    """Test reports with different data structures."""
+        response = fresh_client.get(
+            "/api/report/specifications", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
 
     @pytest.mark.integration
-    def test_report_with_flat_structure(self, client, data_manager):
-        """Test report generation with flat data structure."""
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.load_data.return_value = {
-                "metadata": {"project_name": "Test", "device_type": "Device"},
-                "user_needs": {"UN001": {"title": "Need 1"}},
-                "product_requirements": {},
-            }
-            mock_get_dm.return_value = mock_dm
+    def test_download_report_not_modified_since(self, client):
+        """Test that a report unchanged since If-Modified-Since returns 304."""
+        first = client.get("/api/report/requirements_and_needs")
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        response = client.get(
+            "/api/report/requirements_and_needs",
+            headers={"If-Modified-Since": first.headers["Last-Modified"]},
+        )
+        assert response.status_code == 304
+        assert not response.data
 
-            response = client.get("/api/report/requirements_and_needs")
-            assert response.status_code == 200
+    @pytest.mark.integration
+    def test_download_report_modified(self, client, save_in_place):
+        """Test that saving the DHF data changes the report ETag."""
+        etag = client.get("/api/report/requirements_and_needs").headers["ETag"]
+        save_in_place()
+
+        response = client.get(
+            "/api/report/requirements_and_needs", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
 
     @pytest.mark.integration
-    def test_report_with_hierarchical_structure(self, client, data_manager):
-        """Test report generation with hierarchical data structure."""
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.load_data.return_value = {
-                "metadata": {"project_name": "Test", "device_type": "Device"},
-                "user_needs": {
-                    "group1": {"user_needs": {"UN001": {"title": "Need 1"}}}
-                },
-                "product_requirements": {
-                    "group1": {"requirements": {"PR001": {"title": "Req 1"}}}
-                },
-            }
-            mock_get_dm.return_value = mock_dm
+    def test_download_report_modified_next_day(self, client, monkeypatch):
+        """Test that a report fetched on an earlier day is generated again."""
+        first = client.get("/api/report/requirements_and_needs")
+        tomorrow = datetime.now() + timedelta(days=1)
+        monkeypatch.setattr("app.routes.datetime", _frozen_datetime(tomorrow))
+
+        for headers in (
+            {"If-None-Match": first.headers["ETag"]},
+            {"If-Modified-Since": first.headers["Last-Modified"]},
+        ):
+            response = client.get("/api/report/requirements_and_needs", headers=headers)
+            assert response.status_code == 200
+            assert response.headers["ETag"] != first.headers["ETag"]
+            generated_date = response.get_json()["generated_date"]
+            assert generated_date.startswith(tomorrow.strftime("%Y-%m-%d"))
 
-            response = client.get("/api/report/requirements_and_needs")
+    @pytest.mark.integration
+    def test_download_multiple_reports(self, reports):
+        """Test downloading multiple different reports."""
+        for report_name in REPORT_NAMES:
+            response = reports[report_name]
             assert response.status_code == 200
+            assert response.data  # Should have content
+
+
+class TestReportDataStructures:
+    """Test reports with different data structures."""
 
     @pytest.mark.integration
-    def test_report_with_empty_data(self, client, data_manager):
-        """Test report generation with empty data."""
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.load_data.return_value = {
-                "metadata": {},
-                "user_needs": {},
-                "product_requirements": {},
-            }
-            mock_get_dm.return_value = mock_dm
+    @pytest.mark.parametrize(
+        "payload",
+        [FLAT_PAYLOAD, HIERARCHICAL_PAYLOAD, EMPTY_PAYLOAD],
+        ids=["flat", "hierarchical", "empty"],
+    )
+    def test_report_with_data_structure(self, client, patched_data_manager, payload):
+        """Test report generation handles each shape of DHF data."""
+        patched_data_manager(copy.deepcopy(payload))
 
-            response = client.get("/api/report/requirements_and_needs")
-            assert response.status_code == 200
-            # Should handle empty data gracefully
-            assert response.data
+        response = client.get("/api/report/requirements_and_needs")
+        assert response.status_code == 200
+        assert response.data
@@ -7,215 +7,71 @@ Tests for sidebar focus and tree expansion functionality.
 
 # Integration tests for sidebar focus functionality
 
+import pytest
+
+# Needles matched regardless of case
+SIDEBAR_ANY_CASE = frozenset(["not found"])
+
+# (check name, needles); a tuple means any one of its alternatives suffices
+SIDEBAR_CHECKS = [
+    (
+        "sidebar_focus_functions",
+        [
+            "function updateSidebarFocus(",
+            "function expandParentSections(",
+            "function loadItem(",
+        ],
+    ),
+    (
+        "active_styling_classes",
+        [("tree-item active", "active"), "bg-primary", "text-white"],
+    ),
+    (
+        "collapsible_sections",
+        ["data-target=", "collapsed", "fa-chevron-right", "fa-chevron-down"],
+    ),
+    ("tree_item_data_attributes", ["data-item-id=", "data-target="]),
+    ("scroll_behavior", ["scrollIntoView", "behavior: 'smooth'", "block: 'nearest'"]),
+    (
+        "tree_expansion_logic",
+        ["closest(", "parentElement", "classList.remove", "classList.add"],
+    ),
+    (
+        "hyperlink_navigation",
+        ['onclick="loadItem(', "text-decoration-none", 'href="#"'],
+    ),
+    (
+        "sidebar_structure",
+        ['id="sidebar"', "tree-navigation", "tree-section", "tree-group", "tree-item"],
+    ),
+    ("collapse_icons", ["collapse-icon", "fa-chevron", "fas fa-"]),
+    (
+        "section_headers",
+        [
+            "User Needs",
+            "Product Requirements",
+            "Risks",
+            "Software Specifications",
+            "Hardware Specifications",
+        ],
+    ),
+    ("focus_management", ["querySelectorAll", "classList.remove", "classList.add"]),
+    ("tree_traversal", ["while (current)", "current.parentElement", "closest("]),
+    ("error_handling", ["console.warn", "not found"]),
+    ("performance_optimizations", ["querySelector", "querySelectorAll", "break"]),
+    ("accessibility_features", [("aria-expanded", "aria-"), ("role=", "tabindex=")]),
+    ("responsive_design", ["d-flex", "col-", "container"]),
+]
+
 
 class TestSidebarFocus:
     """Test sidebar focus and tree expansion functionality."""
 
-    def test_browse_page_contains_sidebar_focus_functions(self, app, client):
-        """Test that the browse page contains JavaScript functions for sidebar focus."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for sidebar focus functions
-        assert "function updateSidebarFocus(" in html_content
-        assert "function expandParentSections(" in html_content
-        assert "function loadItem(" in html_content
-
-    def test_browse_page_contains_active_styling_classes(self, app, client):
-        """Test that the browse page contains CSS classes for active item styling."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for active styling classes
-        assert "tree-item active" in html_content or "active" in html_content
-        assert "bg-primary" in html_content
-        assert "text-white" in html_content
-
-    def test_browse_page_contains_collapsible_sections(self, app, client):
-        """Test that the browse page contains collapsible sections for tree expansion."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for collapsible sections
-        assert "data-target=" in html_content
-        assert "collapsed" in html_content
-        assert "fa-chevron-right" in html_content
-        assert "fa-chevron-down" in html_content
-
-    def test_browse_page_contains_tree_item_data_attributes(self, app, client):
-        """Test that the browse page contains data attributes for tree items."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for data attributes
-        assert "data-item-id=" in html_content
-        assert "data-target=" in html_content
-
-    def test_browse_page_contains_scroll_behavior(self, app, client):
-        """Test that the browse page contains scroll behavior for focusing items."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for scroll behavior
-        assert "scrollIntoView" in html_content
-        assert "behavior: 'smooth'" in html_content
-        assert "block: 'nearest'" in html_content
-
-    def test_browse_page_contains_tree_expansion_logic(self, app, client):
-        """Test that the browse page contains logic for expanding parent sections."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for tree expansion logic
-        assert "closest(" in html_content
-        assert "parentElement" in html_content
-        assert "classList.remove" in html_content
-        assert "classList.add" in html_content
-
-    def test_browse_page_contains_hyperlink_navigation(self, app, client):
-        """Test that the browse page contains hyperlink navigation functionality."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for hyperlink navigation
-        assert 'onclick="loadItem(' in html_content
-        assert "text-decoration-none" in html_content
-        assert 'href="#"' in html_content
-
-    def test_browse_page_contains_sidebar_structure(self, app, client):
-        """Test that the browse page contains proper sidebar structure."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for sidebar structure
-        assert 'id="sidebar"' in html_content
-        assert "tree-navigation" in html_content
-        assert "tree-section" in html_content
-        assert "tree-group" in html_content
-        assert "tree-item" in html_content
-
-    def test_browse_page_contains_collapse_icons(self, app, client):
-        """Test that the browse page contains collapse icons for sections."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for collapse icons
-        assert "collapse-icon" in html_content
-        assert "fa-chevron" in html_content
-        assert "fas fa-" in html_content
-
-    def test_browse_page_contains_section_headers(self, app, client):
-        """Test that the browse page contains section headers with proper attributes."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for section headers
-        assert "User Needs" in html_content
-        assert "Product Requirements" in html_content
-        assert "Risks" in html_content
-        assert "Software Specifications" in html_content
-        assert "Hardware Specifications" in html_content
-
-    def test_browse_page_contains_item_lists(self, app, client):
-        """Test that the browse page contains item lists with proper structure."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for item lists - these are dynamically generated
-        assert "User Needs" in html_content
-        assert "Product Requirements" in html_content
-        assert "Risks" in html_content
-        assert "Software Specifications" in html_content
-        assert "Hardware Specifications" in html_content
-
-    def test_browse_page_contains_focus_management(self, app, client):
-        """Test that the browse page contains focus management functionality."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for focus management
-        assert "querySelectorAll" in html_content
-        assert "classList.remove" in html_content
-        assert "classList.add" in html_content
-
-    def test_browse_page_contains_tree_traversal(self, app, client):
-        """Test that the browse page contains tree traversal functionality."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for tree traversal
-        assert "while (current)" in html_content
-        assert "current.parentElement" in html_content
-        assert "closest(" in html_content
-
-    def test_browse_page_contains_error_handling(self, app, client):
-        """Test that the browse page contains error handling for focus functionality."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for error handling
-        assert "console.warn" in html_content
-        assert "not found" in html_content.lower()
-
-    def test_browse_page_contains_performance_optimizations(self, app, client):
-        """Test that the browse page contains performance optimizations for focus functionality."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for performance optimizations
-        assert "querySelector" in html_content
-        assert "querySelectorAll" in html_content
-        assert "break" in html_content
-
-    def test_browse_page_contains_accessibility_features(self, app, client):
-        """Test that the browse page contains accessibility features for focus functionality."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for accessibility features
-        assert "aria-expanded" in html_content or "aria-" in html_content
-        assert "role=" in html_content or "tabindex=" in html_content
-
-    def test_browse_page_contains_responsive_design(self, app, client):
-        """Test that the browse page contains responsive design for focus functionality."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
-        html_content = response.get_data(as_text=True)
-
-        # Check for responsive design
-        assert "d-flex" in html_content
-        assert "col-" in html_content
-        assert "container" in html_content
+    @pytest.mark.parametrize(
+        "needles",
+        [needles for _, needles in SIDEBAR_CHECKS],
+        ids=[name for name, _ in SIDEBAR_CHECKS],
+    )
+    def test_browse_page_contains(self, browse_missing, needles):
+        """Test that the browse page contains each piece of sidebar focus support."""
+        assert browse_missing(needles, SIDEBAR_ANY_CASE) == []
@@ -3,81 +3,95 @@
 
 """Integration tests for validation page and PDF export."""
 
-from unittest.mock import MagicMock, mock_open, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-
-class TestValidationPage:
-    """Test cases for validation page."""
-
-    @pytest.mark.ui
-    def test_validation_page_loads(self, client, data_manager):
-        """Test validation page loads successfully."""
-        response = client.get("/validation")
-        assert response.status_code == 200
-        assert b"System Validation" in response.data or b"validation" in response.data
-
-    @pytest.mark.ui
-    def test_validation_page_with_specifications(self, client, data_manager):
-        """Test validation page loads with specifications file."""
-        # The specifications.md file should exist in docs/
-        with patch("os.path.exists", return_value=True):
-            with patch(
-                "builtins.open",
-                mock_open(read_data="# Test Spec\n## Section\n**Bold text**"),
-            ):
-                response = client.get("/validation")
-                assert response.status_code == 200
-
-    @pytest.mark.ui
-    def test_validation_page_without_specifications(self, client, data_manager):
-        """Test validation page handles missing specifications file."""
-        with patch("os.path.exists", return_value=False):
-            response = client.get("/validation")
-            assert response.status_code == 200
-
-    @pytest.mark.ui
-    def test_validation_page_with_markdown_tables(self, client, data_manager):
-        """Test validation page handles markdown tables."""
-        markdown_table = """
+MARKDOWN_TABLE = """
 | ID | Title | Description |
 |---|---|---|
 | TEST-001 | Test | Description |
 | TEST-002 | Test2 | Description2 |
 """
-        with patch("os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=markdown_table)):
-                response = client.get("/validation")
-                assert response.status_code == 200
-
-    @pytest.mark.ui
-    def test_validation_page_with_lists(self, client, data_manager):
-        """Test validation page handles markdown lists."""
-        markdown_lists = """
+MARKDOWN_LISTS = """
 - Item 1
 - Item 2
 * Item 3
 * Item 4
 """
-        with patch("os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=markdown_lists)):
-                response = client.get("/validation")
-                assert response.status_code == 200
-
-    @pytest.mark.ui
-    def test_validation_page_with_code_blocks(self, client, data_manager):
-        """Test validation page handles code blocks."""
-        markdown_code = """
+MARKDOWN_CODE = """
 ```python
 def test():
     pass
 ```
 """
-        with patch("os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=markdown_code)):
-                response = client.get("/validation")
-                assert response.status_code == 200
+
+
+def _finished_run(returncode, stdout, stderr=""):
+    """A subprocess.run stand-in that returns a finished process."""
+    result = SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+    return lambda *args, **kwargs: result
+
+
+def _failing_run(*args, **kwargs):
+    """A subprocess.run stand-in that fails to start the process."""
+    raise OSError("Test error")
+
+
+@pytest.fixture
+def spec_file(tmp_path, monkeypatch):
+    """Point the validation page at a specifications file under tmp_path.
+
+    The file does not exist until the test writes it.
+    """
+    path = tmp_path / "specifications.md"
+    monkeypatch.setattr("app.routes.SPECIFICATIONS_PATH", str(path))
+    return path
+
+
+class TestValidationPage:
+    """Test cases for validation page."""
+
+    @pytest.mark.ui
+    def test_validation_page_loads(self, get_page):
+        """Test validation page loads successfully."""
+        response = get_page("/validation")
+        assert response.status_code == 200
+        assert b"System Validation" in response.data or b"validation" in response.data
+
+    @pytest.mark.ui
+    @pytest.mark.parametrize(
+        "markdown, expected",
+        [
+            (
+                "# Test Spec\n## Section\n**Bold text**",
+                b"<h2>Section</h2><br><strong>Bold text</strong>",
+            ),
+            (
+                MARKDOWN_TABLE,
+                b"<th>ID</th><th>Title</th><th>Description</th>",
+            ),
+            (MARKDOWN_LISTS, b"<ul><li>Item 1</li>"),
+            (MARKDOWN_CODE, b"<pre><code>python"),
+        ],
+        ids=["specifications", "markdown_tables", "lists", "code_blocks"],
+    )
+    def test_validation_page_renders_specifications(
+        self, client, spec_file, markdown, expected
+    ):
+        """Test validation page converts the specifications markdown to HTML."""
+        spec_file.write_text(markdown, encoding="utf-8")
+
+        response = client.get("/validation")
+        assert response.status_code == 200
+        assert expected in response.data
+
+    @pytest.mark.ui
+    def test_validation_page_without_specifications(self, client, spec_file):
+        """Test validation page handles missing specifications file."""
+        response = client.get("/validation")
+        assert response.status_code == 200
 
     @pytest.mark.ui
     def test_validation_page_error_handling(self, client, data_manager):
@@ -91,80 +105,65 @@ def test():
 class TestPDFExport:
     """Test cases for PDF export functionality."""
 
-    @pytest.mark.integration
-    def test_export_validation_pdf_success(self, client, data_manager):
-        """Test PDF export functionality."""
-        # Just test the endpoint exists and responds
-        response = client.post("/api/export-validation-pdf")
-        # May fail without reportlab but should handle gracefully
-        assert response.status_code in [200, 404, 500]
-
     @pytest.mark.integration
     def test_export_validation_pdf_endpoint(self, client, data_manager):
-        """Test PDF export endpoint accessibility."""
+        """Test PDF export endpoint responds."""
         response = client.post("/api/export-validation-pdf")
-        # Endpoint should exist
-        assert response.status_code in [200, 404, 500]
+        # Without the optional reportlab package the export fails with a 500
+        assert response.status_code in [200, 500]
 
 
 class TestRunTests:
     """Test cases for run tests API endpoint."""
 
     @pytest.mark.integration
-    def test_run_tests_endpoint(self, client, data_manager):
+    def test_run_tests_never_spawns_pytest(self, client):
+        """Test the shared subprocess stub answers an unpatched test run."""
+        response = client.post("/api/run-tests")
+        assert response.status_code == 200
+        assert response.get_json()["summary"]["total"] == 0
+
+    @pytest.mark.integration
+    def test_run_tests_endpoint(self, client, data_manager, monkeypatch):
         """Test run tests endpoint."""
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.returncode = 0
-            mock_result.stdout = "Test output"
-            mock_result.stderr = ""
-            mock_run.return_value = mock_result
-
-            response = client.post("/api/run-tests")
-            assert response.status_code == 200
-            data = response.get_json()
-            # Check for expected fields in response
-            assert data is not None
-            assert "success" in data or "summary" in data or "output" in data
+        monkeypatch.setattr("subprocess.run", _finished_run(0, "Test output"))
+
+        response = client.post("/api/run-tests")
+        assert response.status_code == 200
+        data = response.get_json()
+        # Check for expected fields in response
+        assert data is not None
+        assert "success" in data or "summary" in data or "output" in data
 
     @pytest.mark.integration
-    def test_run_tests_failure(self, client, data_manager):
+    def test_run_tests_failure(self, client, data_manager, monkeypatch):
         """Test run tests endpoint when tests fail."""
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.returncode = 1
-            mock_result.stdout = "Test output"
-            mock_result.stderr = "Test errors"
-            mock_run.return_value = mock_result
-
-            response = client.post("/api/run-tests")
-            assert response.status_code == 200
-            data = response.get_json()
-            # Check for expected fields in response
-            assert data is not None
+        monkeypatch.setattr(
+            "subprocess.run", _finished_run(1, "Test output", "Test errors")
+        )
+
+        response = client.post("/api/run-tests")
+        assert response.status_code == 200
+        data = response.get_json()
+        # Check for expected fields in response
+        assert data is not None
 
     @pytest.mark.integration
-    def test_run_tests_error(self, client, data_manager):
+    def test_run_tests_error(self, client, data_manager, monkeypatch):
         """Test run tests endpoint handles errors."""
-        with patch("subprocess.run", side_effect=Exception("Test error")):
-            response = client.post("/api/run-tests")
-            # May return 200 or 500 depending on error handling
-            assert response.status_code in [200, 500]
+        monkeypatch.setattr("subprocess.run", _failing_run)
+
+        response = client.post("/api/run-tests")
+        # May return 200 or 500 depending on error handling
+        assert response.status_code in [200, 500]
 
 
 class TestTestResults:
     """Test cases for test results endpoint."""
 
     @pytest.mark.integration
-    def test_get_test_results_endpoint(self, client, data_manager):
-        """Test getting test results endpoint."""
-        response = client.get("/api/test-results")
-        # Endpoint may or may not exist, accept various responses
-        assert response.status_code in [200, 404, 500]
-
-    @pytest.mark.integration
-    def test_get_test_results_basic(self, client, data_manager):
-        """Test test results endpoint basic functionality."""
+    def test_get_test_results_endpoint(self, client):
+        """Test that there is no stored test results endpoint."""
         response = client.get("/api/test-results")
-        # Should respond with some status
-        assert response.status_code in [200, 404, 500]
+        # Results are only returned by /api/run-tests
+        assert response.status_code == 404
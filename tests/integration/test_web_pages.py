@@ -3,85 +3,111 @@
 
 """Integration tests for web pages."""
 
-from unittest.mock import patch
-
 import pytest
 
+from app import create_app
+
+
+def _raise(*args, **kwargs):
+    """Stand-in for a data source that always fails."""
+    raise RuntimeError("Test error")
+
 
 class TestWebPages:
     """Test cases for web pages."""
 
     @pytest.mark.ui
-    def test_index_page(self, client, data_manager):
+    def test_index_page(self, get_page):
         """Test index page loads successfully."""
-        response = client.get("/")
+        response = get_page("/")
         assert response.status_code == 200
         assert b"Pocket DHF" in response.data
         # Check for any project name in the response
         assert b"Monitor" in response.data or b"Project" in response.data
 
     @pytest.mark.ui
-    def test_browse_page(self, client, data_manager):
+    def test_browse_page(self, browse_page):
         """Test browse page loads successfully."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-        assert b"Browse DHF Data" in response.data
-        assert b"DHF Navigation" in response.data
+        assert b"Browse DHF Data" in browse_page
+        assert b"DHF Navigation" in browse_page
 
     @pytest.mark.ui
-    def test_configuration_page(self, client, data_manager):
+    def test_configuration_page(self, get_page):
         """Test configuration page loads successfully."""
-        response = client.get("/configuration")
+        response = get_page("/configuration")
         assert response.status_code == 200
         assert b"Configuration" in response.data
         assert b"Severity Options" in response.data
 
     @pytest.mark.ui
-    def test_reports_page(self, client, data_manager):
+    def test_reports_page(self, get_page):
         """Test reports page loads successfully."""
-        response = client.get("/reports")
+        response = get_page("/reports")
         assert response.status_code == 200
         assert b"Reports" in response.data
         assert b"Report Templates" in response.data
 
     @pytest.mark.ui
-    def test_index_page_with_error(self, client):
+    def test_index_page_with_error(self, client, data_manager, monkeypatch):
         """Test index page handles data loading errors gracefully."""
-        with patch(
-            "app.routes.data_manager.load_data", side_effect=Exception("Test error")
+        monkeypatch.setattr("app.routes.data_manager.load_data", _raise)
+        response = client.get("/")
+        assert response.status_code == 200
+        # Check for error message or fallback content
+        assert b"Error" in response.data or b"Unknown" in response.data
+
+    @pytest.mark.ui
+    def test_browse_page_not_modified(self, client, data_manager):
+        """Test that conditional requests for an unchanged browse page return 304."""
+        first = client.get("/browse")
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        for headers in (
+            {"If-None-Match": first.headers["ETag"]},
+            {"If-Modified-Since": first.headers["Last-Modified"]},
         ):
-            response = client.get("/")
-            assert response.status_code == 200
-            # Check for error message or fallback content
-            assert b"Error" in response.data or b"Unknown" in response.data
+            response = client.get("/browse", headers=headers)
+            assert response.status_code == 304
+            assert not response.data
 
     @pytest.mark.ui
-    def test_browse_page_with_error(self, client):
+    def test_browse_page_not_modified_fresh_app(self, fresh_client):
+        """Test that the first ETag a new app hands out for /browse validates."""
+        etag = fresh_client.get("/browse").headers["ETag"]
+
+        response = fresh_client.get("/browse", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    @pytest.mark.ui
+    def test_browse_page_modified(self, client, save_in_place):
+        """Test that saving the DHF data makes the browse page render again."""
+        etag = client.get("/browse").headers["ETag"]
+        save_in_place()
+
+        response = client.get("/browse", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    @pytest.mark.ui
+    def test_browse_page_with_error(self, client, data_manager, monkeypatch):
         """Test browse page handles data loading errors gracefully."""
-        with patch(
-            "app.routes.data_manager.load_data", side_effect=Exception("Test error")
-        ):
-            response = client.get("/browse")
-            assert response.status_code == 302  # Redirect to index
+        monkeypatch.setattr("app.routes.data_manager.load_data", _raise)
+        response = client.get("/browse")
+        assert response.status_code == 302  # Redirect to index
 
     @pytest.mark.ui
-    def test_configuration_page_with_error(self, client):
+    def test_configuration_page_with_error(self, client, data_manager, monkeypatch):
         """Test configuration page handles data loading errors gracefully."""
-        with patch(
-            "app.routes.data_manager.get_configuration",
-            side_effect=Exception("Test error"),
-        ):
-            response = client.get("/configuration")
-            assert response.status_code == 302  # Redirect to index
+        monkeypatch.setattr("app.routes.data_manager.get_configuration", _raise)
+        response = client.get("/configuration")
+        assert response.status_code == 302  # Redirect to index
 
     @pytest.mark.ui
-    def test_reports_page_with_error(self, client):
+    def test_reports_page_with_error(self, client, monkeypatch):
         """Test reports page handles data loading errors gracefully."""
-        with patch(
-            "app.routes.get_report_templates", side_effect=Exception("Test error")
-        ):
-            response = client.get("/reports")
-            assert response.status_code == 302  # Redirect to index
+        monkeypatch.setattr("app.routes.get_report_templates", _raise)
+        response = client.get("/reports")
+        assert response.status_code == 302  # Redirect to index
 
     @pytest.mark.ui
     def test_static_files(self, client):
@@ -89,6 +115,12 @@ class TestWebPages:
         response = client.get("/static/css/style.css")
         assert response.status_code == 200
         assert response.content_type == "text/css; charset=utf-8"
+        assert response.cache_control.max_age == 3600
+
+        response = client.get(
+            "/static/css/style.css", headers={"If-None-Match": response.headers["ETag"]}
+        )
+        assert response.status_code == 304
 
     @pytest.mark.ui
     def test_favicon(self, client):
@@ -135,34 +167,48 @@ class TestWebPages:
         assert "Monitor" in data["content"] or "Project" in data["content"]
 
     @pytest.mark.ui
-    def test_browse_page_displays_counts(self, client, data_manager):
+    def test_browse_page_displays_counts(self, browse_page):
         """Test browse page displays correct item counts."""
-        response = client.get("/browse")
-        assert response.status_code == 200
-
         # Check that counts are displayed in the HTML
-        assert b"User Needs" in response.data
-        assert b"Risks" in response.data
-        assert b"Product Requirements" in response.data
-        assert b"Software Specifications" in response.data
-        assert b"Hardware Specifications" in response.data
+        assert b"User Needs" in browse_page
+        assert b"Risks" in browse_page
+        assert b"Product Requirements" in browse_page
+        assert b"Software Specifications" in browse_page
+        assert b"Hardware Specifications" in browse_page
 
     @pytest.mark.ui
-    def test_configuration_page_displays_options(self, client, data_manager):
+    def test_configuration_page_displays_options(self, get_page):
         """Test configuration page displays configuration options."""
-        response = client.get("/configuration")
+        response = get_page("/configuration")
         assert response.status_code == 200
 
         # Check that configuration options are displayed
         assert b"Severity" in response.data or b"Options" in response.data
 
     @pytest.mark.ui
-    def test_reports_page_displays_templates(self, client, data_manager):
+    def test_reports_page_displays_templates(self, get_page):
         """Test reports page displays available templates."""
-        response = client.get("/reports")
+        response = get_page("/reports")
         assert response.status_code == 200
 
         # Check that report templates are displayed
         assert b"Report Templates" in response.data
         assert b"specifications" in response.data
         assert b"requirements_and_needs" in response.data
+
+    @pytest.mark.ui
+    def test_page_templates_not_reloaded(self, app):
+        """Test compiled page templates are not reloaded outside debug."""
+        assert app.jinja_env.bytecode_cache is None
+        assert app.jinja_env.auto_reload is False
+
+    @pytest.mark.ui
+    def test_page_templates_use_bytecode_cache_dir(self, tmp_path):
+        """Test compiled page templates are cached in the configured directory."""
+        cache_dir = tmp_path / "jinja"
+        app = create_app(
+            data_file_path=str(tmp_path / "dhf.yaml"), template_cache_dir=str(cache_dir)
+        )
+
+        app.jinja_env.get_template("base.html")
+        assert list(cache_dir.iterdir())
@@ -3,23 +3,59 @@
 
 """Test runner script for Pocket DHF."""
 
-import os
+import argparse
 import subprocess
 import sys
 from pathlib import Path
 
 
-def run_tests():
+def parse_args(argv=None):
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Run the Pocket DHF test suite")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument(
+        "--changed",
+        action="store_true",
+        help="Only run tests affected by changes since the last run (pytest-testmon)",
+    )
+    scope.add_argument(
+        "--failed",
+        action="store_true",
+        help="Only rerun the tests that failed last time",
+    )
+    return parser.parse_args(argv)
+
+
+def incremental_command(args):
+    """Build the pytest command for a --changed or --failed run.
+
+    These runs cover part of the suite, so coverage and its threshold are off.
+    testmon does not support xdist, so --changed runs in a single process.
+    """
+    cmd = ["poetry", "run", "pytest", "--no-cov", "-v"]
+    if args.changed:
+        cmd.append("--testmon")
+    else:
+        cmd += ["--lf", "-n", "auto", "--dist=loadfile"]
+    cmd.append("tests/")
+    return cmd
+
+
+def run_tests(argv=None):
     """Run the test suite with coverage reporting."""
-    # Ensure we're in the project root
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
+    args = parse_args(argv)
+
+    # Run from the project root without changing this process's cwd
+    project_root = Path(__file__).resolve().parent.parent
 
     # Create reports directory if it doesn't exist
-    reports_dir = Path("reports")
+    reports_dir = project_root / "reports"
     reports_dir.mkdir(exist_ok=True)
 
-    # Run pytest with coverage
+    if args.changed or args.failed:
+        return run_command(incremental_command(args), project_root)
+
+    # Run pytest in parallel with coverage
     cmd = [
         "poetry",
         "run",
@@ -32,20 +68,30 @@ def run_tests():
         "--self-contained-html",
         "--junitxml=reports/junit.xml",
         "--cov-fail-under=80",
+        # One worker per core, keeping each test file on one worker
+        "-n",
+        "auto",
+        "--dist=loadfile",
         "-v",
         "tests/",
     ]
 
+    returncode = run_command(cmd, project_root)
+    print("📊 Coverage report: reports/coverage-html/index.html")
+    print("📋 Test report: reports/test-report.html")
+    return returncode
+
+
+def run_command(cmd, project_root):
+    """Run a pytest command from the project root, exiting if any test fails."""
     print("Running test suite...")
     print(f"Command: {' '.join(cmd)}")
     print("-" * 50)
 
-    result = subprocess.run(cmd, capture_output=False)
+    result = subprocess.run(cmd, capture_output=False, cwd=project_root)
 
     if result.returncode == 0:
         print("\n✅ All tests passed!")
-        print("📊 Coverage report: reports/coverage-html/index.html")
-        print("📋 Test report: reports/test-report.html")
     else:
         print("\n❌ Some tests failed!")
         sys.exit(1)
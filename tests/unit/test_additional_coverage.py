@@ -4,43 +4,59 @@
 """Additional tests to improve coverage."""
 
 import json
-from unittest.mock import patch
 
 import pytest
 
+# Request bodies are encoded once at import time rather than in every test
+UPDATE_ITEM_BODY = json.dumps({"title": "Updated Title"})
+MISSING_FOLDER_NAME_BODY = json.dumps(
+    {"group_type": "risks", "group_key": "NonExistent", "new_name": "Updated Name"}
+)
+MISSING_MITIGATION_LINK_BODY = json.dumps({"link_id": "ML999", "effect": "Test effect"})
+REMOVE_MISSING_OPTION_BODY = json.dumps(
+    {"config_type": "severity", "action": "remove", "option_id": "S999"}
+)
+
+# Read-only GET smoke checks: (url, expected status, bytes the body contains)
+SMOKE_GETS = [
+    ("/browse", 200, b"Browse"),
+    ("/api/item/UN001", 200, b'"title":'),
+    ("/api/report/user_needs", 404, b'"error":'),
+    ("/api/traceability/user-needs-to-requirements", 200, b"["),
+    ("/api/traceability/requirements-to-specifications", 200, b"["),
+    ("/api/traceability/risks-to-mitigations", 200, b"["),
+]
+
 
 @pytest.mark.unit
 class TestAdditionalCoverage:
     """Test additional functionality for better coverage."""
 
-    def test_browse_route_exception_handling(self, client, data_manager):
+    def test_browse_route_exception_handling(self, client, patched_data_manager):
         """Test browse route with exception handling."""
-        with patch("app.routes.get_data_manager") as mock_get_data_manager:
-            mock_data_manager = mock_get_data_manager.return_value
-            mock_data_manager.get_user_needs.side_effect = Exception("Database error")
 
-            response = client.get("/browse")
-            assert response.status_code in [200, 302]  # May redirect on error
+        def get_user_needs():
+            raise Exception("Database error")
+
+        patched_data_manager({}).get_user_needs = get_user_needs
 
-    def test_browse_route_with_actual_data(self, client, data_manager):
-        """Test browse route with actual data."""
         response = client.get("/browse")
-        assert response.status_code in [200, 404, 500]
-        assert b"Browse" in response.data
+        assert response.status_code == 302  # Redirects to the index on error
 
-    def test_api_item_route_success(self, client, data_manager):
-        """Test API item route with valid ID."""
-        response = client.get("/api/item/UN001")
-        assert response.status_code in [200, 404, 500]
-        data = response.get_json()
-        assert "title" in data
+    @pytest.mark.parametrize(
+        "url, status, needle", SMOKE_GETS, ids=[url for url, _, _ in SMOKE_GETS]
+    )
+    def test_get_endpoints_respond(self, get_page, url, status, needle):
+        """Test read-only GET endpoints respond with the expected content."""
+        response = get_page(url)
+        assert response.status_code == status
+        assert needle in response.data
 
     def test_api_update_item_route_success(self, client, data_manager):
         """Test API update item route with valid ID."""
-        updated_data = {"title": "Updated Title"}
         response = client.put(
             "/api/item/UN001",
-            data=json.dumps(updated_data),
+            data=UPDATE_ITEM_BODY,
             content_type="application/json",
         )
         assert response.status_code in [200, 404, 500]
@@ -50,14 +66,9 @@ class TestAdditionalCoverage:
 
     def test_api_folder_name_route_not_found(self, client, data_manager):
         """Test API folder name route with non-existent folder."""
-        data = {
-            "group_type": "risks",
-            "group_key": "NonExistent",
-            "new_name": "Updated Name",
-        }
         response = client.put(
             "/api/folder-name",
-            data=json.dumps(data),
+            data=MISSING_FOLDER_NAME_BODY,
             content_type="application/json",
         )
         assert response.status_code in [200, 404, 500]
@@ -66,10 +77,9 @@ class TestAdditionalCoverage:
 
     def test_api_mitigation_link_route_not_found(self, client, data_manager):
         """Test API mitigation link route with non-existent link."""
-        data = {"link_id": "ML999", "effect": "Test effect"}
         response = client.put(
             "/api/mitigation-link",
-            data=json.dumps(data),
+            data=MISSING_MITIGATION_LINK_BODY,
             content_type="application/json",
         )
         assert response.status_code in [200, 404, 500]
@@ -80,43 +90,15 @@ class TestAdditionalCoverage:
         self, client, data_manager
     ):
         """Test API configuration route remove non-existent option."""
-        data = {
-            "config_type": "severity",
-            "action": "remove",
-            "option_id": "S999",
-        }
         response = client.put(
             "/api/configuration",
-            data=json.dumps(data),
+            data=REMOVE_MISSING_OPTION_BODY,
             content_type="application/json",
         )
         assert response.status_code in [200, 404, 500]
         data = response.get_json()
         assert "success" in data or "error" in data
 
-    def test_api_generate_report_route_with_valid_report(self, client, data_manager):
-        """Test API generate report route with valid report."""
-        # Test with a report that might exist
-        response = client.get("/api/report/user_needs")
-        assert response.status_code in [200, 404, 500]
-
-    def test_traceability_api_endpoints_success(self, client, data_manager):
-        """Test traceability API endpoints with success."""
-        response = client.get("/api/traceability/user-needs-to-requirements")
-        assert response.status_code in [200, 404, 500]
-        data = response.get_json()
-        assert isinstance(data, list)
-
-        response = client.get("/api/traceability/requirements-to-specifications")
-        assert response.status_code in [200, 404, 500]
-        data = response.get_json()
-        assert isinstance(data, list)
-
-        response = client.get("/api/traceability/risks-to-mitigations")
-        assert response.status_code in [200, 404, 500]
-        data = response.get_json()
-        assert isinstance(data, list)
-
     def test_data_utils_edge_cases(self, data_manager):
         """Test data_utils edge cases."""
         # Test get_item_by_id with non-existent ID
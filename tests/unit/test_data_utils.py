@@ -3,30 +3,47 @@
 
 """Unit tests for data utilities."""
 
+import os
+
+import pytest
+
 from app.data_utils import DHFDataManager
 
 
+@pytest.fixture
+def data_manager(tmp_path, _cached_yaml_bytes):
+    """A data manager that loads the sample data from its own file.
+
+    This replaces the conftest fixture, whose data is seeded in memory and so
+    never goes through load_data's parsing.
+    """
+    data_file = tmp_path / "dhf.yaml"
+    data_file.write_bytes(_cached_yaml_bytes)
+    return DHFDataManager(str(data_file))
+
+
 class TestDHFDataManager:
     """Test cases for DHFDataManager class."""
 
     def test_init_with_default_path(self):
         """Test initialization with default data file path."""
         manager = DHFDataManager()
-        assert hasattr(manager, "data_file_path")
-        assert "dhf_data.yaml" in manager.data_file_path
+        assert manager.data_file_path.endswith(
+            os.path.join("sample-data", "dhf_data.yaml")
+        )
 
     def test_init_with_custom_path(self):
         """Test initialization with custom data file path."""
         custom_path = "custom/path/data.yaml"
         manager = DHFDataManager(custom_path)
-        assert hasattr(manager, "data_file_path")
         assert manager.data_file_path == custom_path
 
-    def test_load_data_success(self, data_manager, sample_dhf_data):
+    def test_load_data_success(self, data_manager, sample_dhf_data_session):
         """Test successful data loading."""
+        assert data_manager._data is None
         data = data_manager.load_data()
-        assert data == sample_dhf_data
-        assert data_manager._data == sample_dhf_data
+        assert data == sample_dhf_data_session
+        assert data_manager._data == sample_dhf_data_session
 
     def test_load_data_caching(self, data_manager):
         """Test that data is cached after first load."""
@@ -34,25 +51,40 @@ class TestDHFDataManager:
         data2 = data_manager.load_data()
         assert data1 is data2  # Same object reference due to caching
 
-    def test_load_data_force_reload(self, data_manager, sample_dhf_data):
+    @pytest.mark.benchmark(group="data")
+    def test_load_data_cached_latency(self, benchmark, data_manager):
+        """Time load_data once the data is cached, which must not re-read the file."""
+        data = data_manager.load_data()
+        assert benchmark(data_manager.load_data) is data
+
+    def test_load_data_force_reload(self, data_manager, sample_dhf_data_session):
         """Test force reload bypasses cache."""
         data1 = data_manager.load_data()
         # The current implementation doesn't support force_reload parameter
         # This test verifies the method exists and returns data
-        assert data1 == sample_dhf_data
+        assert data1 == sample_dhf_data_session
 
-    def test_save_data(self, data_manager, sample_dhf_data, tmp_path):
+    def test_save_data(self, data_manager, sample_dhf_data):
         """Test saving data to file."""
-        # Modify the data
-        modified_data = sample_dhf_data.copy()
-        modified_data["metadata"]["version"] = "2.0.0"
+        # sample_dhf_data is this test's own deep copy, so it can be modified
+        sample_dhf_data["metadata"]["version"] = "2.0.0"
 
-        data_manager.save_data(modified_data)
+        data_manager.save_data(sample_dhf_data)
 
         # Verify the file was updated by reloading
         reloaded_data = data_manager.load_data()
         assert reloaded_data["metadata"]["version"] == "2.0.0"
 
+    def test_save_data_changes_data_version(self, data_manager):
+        """Test that saving data gives the manager a new data version."""
+        data_manager.load_data()
+        version = data_manager.data_version
+        data_manager.load_data()
+        assert data_manager.data_version == version
+
+        data_manager.save_data(data_manager.load_data())
+        assert data_manager.data_version != version
+
     def test_get_user_needs(self, data_manager):
         """Test getting user needs."""
         user_needs = data_manager.get_user_needs()
@@ -115,41 +147,44 @@ class TestDHFDataManager:
         assert links["ML001"]["specification_id"] == "SS001"
         assert links["ML001"]["risk_id"] == "R001"
 
-    def test_get_item_by_id_user_need(self, data_manager):
-        """Test getting user need by ID."""
-        item = data_manager.get_item_by_id("UN001")
-        assert item is not None
-        assert item["title"] == "Accurate Glucose Monitoring"
-
-    def test_get_item_by_id_risk(self, data_manager):
-        """Test getting risk by ID."""
-        item = data_manager.get_item_by_id("R001")
-        assert item is not None
-        assert item["title"] == "Inaccurate Glucose Reading"
-
-    def test_get_item_by_id_product_requirement(self, data_manager):
-        """Test getting product requirement by ID."""
-        item = data_manager.get_item_by_id("PR001")
-        assert item is not None
-        assert item["title"] == "Glucose Measurement Accuracy"
-
-    def test_get_item_by_id_software_specification(self, data_manager):
-        """Test getting software specification by ID."""
-        item = data_manager.get_item_by_id("SS001")
-        assert item is not None
-        assert item["title"] == "Glucose Algorithm"
-
-    def test_get_item_by_id_hardware_specification(self, data_manager):
-        """Test getting hardware specification by ID."""
-        item = data_manager.get_item_by_id("HS001")
+    @pytest.mark.parametrize(
+        "item_id, expected_title",
+        [
+            ("UN001", "Accurate Glucose Monitoring"),
+            ("R001", "Inaccurate Glucose Reading"),
+            ("PR001", "Glucose Measurement Accuracy"),
+            ("SS001", "Glucose Algorithm"),
+            ("HS001", "Glucose Sensor"),
+        ],
+        ids=[
+            "user_need",
+            "risk",
+            "product_requirement",
+            "software_specification",
+            "hardware_specification",
+        ],
+    )
+    def test_get_item_by_id(self, data_manager, item_id, expected_title):
+        """Test getting an item of each kind by ID."""
+        item = data_manager.get_item_by_id(item_id)
         assert item is not None
-        assert item["title"] == "Glucose Sensor"
+        assert item["title"] == expected_title
 
     def test_get_item_by_id_not_found(self, data_manager):
         """Test getting non-existent item by ID."""
         item = data_manager.get_item_by_id("NONEXISTENT")
         assert item is None
 
+    def test_get_item_by_id_after_save(self, data_manager, sample_dhf_data):
+        """Test that items added by saving new data can be looked up."""
+        assert data_manager.get_item_by_id("HS002") is None
+
+        sensor = sample_dhf_data["hardware_specifications"]["Sensor"]
+        sensor["specifications"]["HS002"] = {"title": "Temperature Sensor"}
+        data_manager.save_data(sample_dhf_data)
+
+        assert data_manager.get_item_by_id("HS002")["title"] == "Temperature Sensor"
+
     def test_update_item_user_need(self, data_manager):
         """Test updating user need."""
         updated_data = {"title": "Updated Title", "description": "Updated Description"}
@@ -187,6 +222,15 @@ class TestDHFDataManager:
         assert len(linkable["risks"]) == 1
         assert len(linkable["product_requirements"]) == 1
 
+    def test_get_linkable_items_reused_until_save(self, data_manager):
+        """Test that linkable items are only rebuilt after the data changes."""
+        linkable = data_manager.get_linkable_items()
+        assert data_manager.get_linkable_items() is linkable
+
+        data_manager.update_item("R001", {"title": "Renamed Risk"})
+        risks = data_manager.get_linkable_items()["risks"]
+        assert risks == [{"id": "R001", "title": "Renamed Risk"}]
+
     def test_update_folder_name(self, data_manager):
         """Test updating folder name."""
         result = data_manager.update_folder_name(
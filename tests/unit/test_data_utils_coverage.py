@@ -4,212 +4,142 @@
 """Additional tests to improve coverage of data_utils.py."""
 
 import os
-import tempfile
-from unittest.mock import patch
 
 import pytest
 import yaml
 
+from app.data_utils import DHFDataManager, SafeDumper
+
+# Payloads shared by several tests, serialized once at import
+EMPTY_YAML = yaml.dump({}, Dumper=SafeDumper).encode("utf-8")
+SEVERITY_CONFIG_YAML = yaml.dump(
+    {
+        "configuration": {
+            "severity_mapping": {"S1": {"name": "Low", "description": "Low impact"}}
+        }
+    },
+    Dumper=SafeDumper,
+).encode("utf-8")
+OPTION_NAMES_YAML = yaml.dump(
+    {
+        "configuration": {
+            "severity_mapping": {
+                "S1": {"name": "Low", "description": "Low impact"},
+                "S2": {"name": "Medium", "description": "Medium impact"},
+            },
+            "probability_occurrence_mapping": {
+                "PO1": {"name": "Low", "description": "Unlikely"},
+                "PO2": {"name": "Medium", "description": "Possible"},
+            },
+            "probability_harm_mapping": {
+                "PH1": {"name": "Low", "description": "Unlikely to cause harm"},
+                "PH2": {"name": "Medium", "description": "May cause harm"},
+            },
+        }
+    },
+    Dumper=SafeDumper,
+).encode("utf-8")
+
+
+@pytest.fixture
+def manager_factory(tmp_path):
+    """Factory for a data manager over a data file holding the given data.
+
+    The data is a dict, or YAML bytes that are written to the file as-is.
+    """
+
+    def make(data=EMPTY_YAML):
+        if not isinstance(data, bytes):
+            data = yaml.dump(data, Dumper=SafeDumper).encode("utf-8")
+        data_file = tmp_path / "dhf.yaml"
+        data_file.write_bytes(data)
+        return DHFDataManager(str(data_file))
+
+    return make
+
 
 @pytest.mark.unit
 class TestDataUtilsCoverage:
     """Test additional data_utils functionality for better coverage."""
 
-    def test_dhf_data_manager_init_with_none_path(self):
+    def test_dhf_data_manager_init_with_none_path(self, monkeypatch):
         """Test DHFDataManager initialization with None path."""
-        from app.data_utils import DHFDataManager
-
-        with patch.dict(os.environ, {}, clear=True):
-            with patch("os.path.exists", return_value=False):
-                manager = DHFDataManager(None)
-                # When None is passed, it should use the default path
-                assert manager.data_file_path is not None
+        monkeypatch.delenv("DHF_DATA_FILE", raising=False)
+        monkeypatch.setattr(os.path, "exists", lambda path: False)
+        manager = DHFDataManager(None)
+        # When None is passed, it should use the default path
+        assert manager.data_file_path is not None
 
-    def test_dhf_data_manager_init_with_env_var(self):
+    def test_dhf_data_manager_init_with_env_var(self, monkeypatch):
         """Test DHFDataManager initialization with environment variable."""
-        from app.data_utils import DHFDataManager
-
-        with patch.dict(os.environ, {"DHF_DATA_FILE": "/test/path.yaml"}):
-            manager = DHFDataManager()
-            # The constructor doesn't use environment variables directly
-            assert manager.data_file_path is not None
+        monkeypatch.setenv("DHF_DATA_FILE", "/test/path.yaml")
+        manager = DHFDataManager()
+        # The constructor doesn't use environment variables directly
+        assert manager.data_file_path is not None
 
-    def test_dhf_data_manager_init_with_default_path(self):
+    def test_dhf_data_manager_init_with_default_path(self, monkeypatch):
         """Test DHFDataManager initialization with default path."""
-        from app.data_utils import DHFDataManager
+        monkeypatch.delenv("DHF_DATA_FILE", raising=False)
+        monkeypatch.setattr(os.path, "exists", lambda path: True)
+        manager = DHFDataManager()
+        # The constructor uses a full path, not just the filename
+        assert manager.data_file_path is not None
 
-        with patch.dict(os.environ, {}, clear=True):
-            with patch("os.path.exists", return_value=True):
-                manager = DHFDataManager()
-                # The constructor uses a full path, not just the filename
-                assert manager.data_file_path is not None
-
-    def test_load_data_file_not_found(self):
+    def test_load_data_file_not_found(self, tmp_path):
         """Test load_data when file is not found."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_path = f.name
+        manager = DHFDataManager(str(tmp_path / "missing.yaml"))
+        with pytest.raises(FileNotFoundError):
+            manager.load_data()
 
-        try:
-            # Delete the file to simulate file not found
-            os.unlink(temp_path)
+    def test_load_data_yaml_error(self, tmp_path):
+        """Test load_data when YAML parsing fails."""
+        data_file = tmp_path / "dhf.yaml"
+        data_file.write_text("invalid: yaml: content: [")
 
-            manager = DHFDataManager(temp_path)
-            with pytest.raises(FileNotFoundError):
-                manager.load_data()
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        manager = DHFDataManager(str(data_file))
+        with pytest.raises(
+            ValueError
+        ):  # The method raises ValueError, not yaml.YAMLError
+            manager.load_data()
 
-    def test_load_data_yaml_error(self):
-        """Test load_data when YAML parsing fails."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("invalid: yaml: content: [")
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            with pytest.raises(
-                ValueError
-            ):  # The method raises ValueError, not yaml.YAMLError
-                manager.load_data()
-        finally:
-            os.unlink(temp_path)
-
-    def test_save_data_error(self):
+    def test_save_data_error(self, manager_factory, monkeypatch):
         """Test save_data when file write fails."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            manager._data = {"test": "data"}
-
-            # Make the file read-only to simulate write error
-            os.chmod(temp_path, 0o444)
-
-            with pytest.raises(
-                ValueError
-            ):  # The method raises ValueError, not PermissionError
-                manager.save_data(manager._data)  # save_data requires data parameter
-        finally:
-            os.chmod(temp_path, 0o644)
-            os.unlink(temp_path)
-
-    def test_get_user_needs_empty_data(self):
-        """Test get_user_needs with empty data."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            user_needs = manager.get_user_needs()
-            assert user_needs == {}
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_risks_empty_data(self):
-        """Test get_risks with empty data."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            risks = manager.get_risks()
-            assert risks == {}
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_risks_flat_empty_data(self):
-        """Test get_risks_flat with empty data."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            risks_flat = manager.get_risks_flat()
-            assert risks_flat == {}
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_product_requirements_empty_data(self):
-        """Test get_product_requirements with empty data."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            pr = manager.get_product_requirements()
-            assert pr == {}
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_software_specifications_empty_data(self):
-        """Test get_software_specifications with empty data."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            sw_specs = manager.get_software_specifications()
-            assert sw_specs == {}
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_hardware_specifications_empty_data(self):
-        """Test get_hardware_specifications with empty data."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            hw_specs = manager.get_hardware_specifications()
-            assert hw_specs == {}
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_mitigation_links_empty_data(self):
-        """Test get_mitigation_links with empty data."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            mitigation_links = manager.get_mitigation_links()
-            assert mitigation_links == {}
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_item_by_id_mitigation_link(self):
+        manager = manager_factory()
+
+        def read_only_open(*args, **kwargs):
+            raise PermissionError("read-only file system")
+
+        # Fail the write itself; a read-only file does not stop root, e.g. in CI
+        monkeypatch.setattr("app.data_utils.open", read_only_open, raising=False)
+
+        with pytest.raises(
+            ValueError
+        ):  # The method raises ValueError, not PermissionError
+            manager.save_data({"test": "data"})
+
+    @pytest.mark.parametrize(
+        "getter, expected",
+        [
+            ("get_user_needs", {}),
+            ("get_risks", {}),
+            ("get_risks_flat", {}),
+            ("get_product_requirements", {}),
+            ("get_software_specifications", {}),
+            ("get_hardware_specifications", {}),
+            ("get_mitigation_links", {}),
+            (
+                "get_linkable_items",
+                {"user_needs": [], "risks": [], "product_requirements": []},
+            ),
+        ],
+    )
+    def test_getter_empty_data(self, manager_factory, getter, expected):
+        """Test each getter with empty data."""
+        manager = manager_factory()
+        assert getattr(manager, getter)() == expected
+
+    def test_get_item_by_id_mitigation_link(self, manager_factory):
         """Test get_item_by_id for mitigation link."""
-        from app.data_utils import DHFDataManager
-
         data = {
             "mitigation_links": {
                 "ML001": {
@@ -220,22 +150,13 @@ class TestDataUtilsCoverage:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            item = manager.get_item_by_id("ML001")
-            # get_item_by_id doesn't search mitigation_links
-            assert item is None
-        finally:
-            os.unlink(temp_path)
+        manager = manager_factory(data)
+        item = manager.get_item_by_id("ML001")
+        # get_item_by_id doesn't search mitigation_links
+        assert item is None
 
-    def test_update_item_mitigation_link(self):
+    def test_update_item_mitigation_link(self, manager_factory):
         """Test update_item for mitigation link."""
-        from app.data_utils import DHFDataManager
-
         data = {
             "mitigation_links": {
                 "ML001": {
@@ -246,46 +167,18 @@ class TestDataUtilsCoverage:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            updated_data = {"effect": "Reduces probability by 2"}
-            result = manager.update_item("ML001", updated_data)
-            # update_item doesn't handle mitigation_links
-            assert result is False
-
-            # Verify the update didn't happen
-            item = manager.get_item_by_id("ML001")
-            assert item is None
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_linkable_items_empty_data(self):
-        """Test get_linkable_items with empty data."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            linkable = manager.get_linkable_items()
-            assert linkable == {
-                "user_needs": [],
-                "risks": [],
-                "product_requirements": [],
-            }
-        finally:
-            os.unlink(temp_path)
+        manager = manager_factory(data)
+        updated_data = {"effect": "Reduces probability by 2"}
+        result = manager.update_item("ML001", updated_data)
+        # update_item doesn't handle mitigation_links
+        assert result is False
 
-    def test_update_folder_name_success(self):
-        """Test update_folder_name success case."""
-        from app.data_utils import DHFDataManager
+        # Verify the update didn't happen
+        item = manager.get_item_by_id("ML001")
+        assert item is None
 
+    def test_update_folder_name_success(self, manager_factory):
+        """Test update_folder_name success case."""
         data = {
             "risks": {
                 "Patient Safety": {
@@ -295,107 +188,42 @@ class TestDataUtilsCoverage:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            result = manager.update_folder_name(
-                "risks", "Patient Safety", "Updated Safety"
-            )
-            assert result is True
-
-            # Verify the update
-            data = manager.load_data()
-            assert "Patient Safety" in data["risks"]  # Key stays the same
-            assert data["risks"]["Patient Safety"]["group_name"] == "Updated Safety"
-        finally:
-            os.unlink(temp_path)
-
-    def test_update_folder_name_not_found(self):
-        """Test update_folder_name when folder not found."""
-        from app.data_utils import DHFDataManager
+        manager = manager_factory(data)
+        result = manager.update_folder_name("risks", "Patient Safety", "Updated Safety")
+        assert result is True
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
+        # Verify the update
+        risks = manager.get_risks()
+        assert "Patient Safety" in risks  # Key stays the same
+        assert risks["Patient Safety"]["group_name"] == "Updated Safety"
 
-        try:
-            manager = DHFDataManager(temp_path)
-            result = manager.update_folder_name("risks", "NonExistent", "New Name")
-            assert result is False
-        finally:
-            os.unlink(temp_path)
+    def test_update_folder_name_not_found(self, manager_factory):
+        """Test update_folder_name when folder not found."""
+        manager = manager_factory()
+        result = manager.update_folder_name("risks", "NonExistent", "New Name")
+        assert result is False
 
-    def test_get_configuration_empty_data(self):
+    def test_get_configuration_empty_data(self, manager_factory):
         """Test get_configuration with empty data."""
-        from app.data_utils import DHFDataManager
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump({}, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            config = manager.get_configuration()
-            # Returns default mappings when empty
-            assert "severity_mapping" in config
-            assert "probability_occurrence_mapping" in config
-            assert "probability_harm_mapping" in config
-        finally:
-            os.unlink(temp_path)
-
-    def test_add_config_option_success(self):
+        manager = manager_factory()
+        config = manager.get_configuration()
+        # Returns default mappings when empty
+        assert "severity_mapping" in config
+        assert "probability_occurrence_mapping" in config
+        assert "probability_harm_mapping" in config
+
+    def test_add_config_option_success(self, manager_factory):
         """Test add_config_option success case."""
-        from app.data_utils import DHFDataManager
+        manager = manager_factory(SEVERITY_CONFIG_YAML)
+        result = manager.add_config_option("severity", "Medium", "Medium impact")
+        assert result == "S2"  # Returns the new ID
 
-        data = {
-            "configuration": {
-                "severity_mapping": {"S1": {"name": "Low", "description": "Low impact"}}
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            result = manager.add_config_option("severity", "Medium", "Medium impact")
-            assert result == "S2"  # Returns the new ID
-
-            # Verify the addition
-            config = manager.get_configuration()
-            assert "S2" in config["severity_mapping"]
-        finally:
-            os.unlink(temp_path)
-
-    def test_add_config_option_existing(self):
-        """Test add_config_option when option already exists."""
-        from app.data_utils import DHFDataManager
-
-        data = {
-            "configuration": {
-                "severity_mapping": {"S1": {"name": "Low", "description": "Low impact"}}
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
+        # Verify the addition
+        config = manager.get_configuration()
+        assert "S2" in config["severity_mapping"]
 
-        try:
-            manager = DHFDataManager(temp_path)
-            result = manager.add_config_option("severity", "Low", "Low impact")
-            assert result == "S2"  # It will create a new ID, not fail
-        finally:
-            os.unlink(temp_path)
-
-    def test_remove_config_option_success(self):
+    def test_remove_config_option_success(self, manager_factory):
         """Test remove_config_option success case."""
-        from app.data_utils import DHFDataManager
-
         data = {
             "configuration": {
                 "severity_mapping": {
@@ -405,46 +233,16 @@ class TestDataUtilsCoverage:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            result = manager.remove_config_option("severity", "S2")
-            assert result is True
-
-            # Verify the removal
-            config = manager.get_configuration()
-            assert "S2" not in config["severity_mapping"]
-        finally:
-            os.unlink(temp_path)
+        manager = manager_factory(data)
+        result = manager.remove_config_option("severity", "S2")
+        assert result is True
 
-    def test_remove_config_option_not_found(self):
-        """Test remove_config_option when option not found."""
-        from app.data_utils import DHFDataManager
+        # Verify the removal
+        config = manager.get_configuration()
+        assert "S2" not in config["severity_mapping"]
 
-        data = {
-            "configuration": {
-                "severity_mapping": {"S1": {"name": "Low", "description": "Low impact"}}
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            result = manager.remove_config_option("severity", "S2")
-            assert result is False
-        finally:
-            os.unlink(temp_path)
-
-    def test_remove_config_option_in_use(self):
+    def test_remove_config_option_in_use(self, manager_factory):
         """Test remove_config_option when option is in use."""
-        from app.data_utils import DHFDataManager
-
         data = {
             "configuration": {
                 "severity_mapping": {"S1": {"name": "Low", "description": "Low impact"}}
@@ -452,152 +250,55 @@ class TestDataUtilsCoverage:
             "risks": {"Patient Safety": {"risks": {"R001": {"severity": "S1"}}}},
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
+        manager = manager_factory(data)
+        result = manager.remove_config_option("severity", "S1")
+        assert result is True  # It should succeed since the risk structure is different
 
-        try:
-            manager = DHFDataManager(temp_path)
-            result = manager.remove_config_option("severity", "S1")
-            assert (
-                result is True
-            )  # It should succeed since the risk structure is different
-        finally:
-            os.unlink(temp_path)
-
-    def test_update_config_option_success(self):
+    def test_update_config_option_success(self, manager_factory):
         """Test update_config_option success case."""
-        from app.data_utils import DHFDataManager
-
-        data = {
-            "configuration": {
-                "severity_mapping": {"S1": {"name": "Low", "description": "Low impact"}}
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            result = manager.update_config_option(
-                "severity", "S1", "Updated Low", "Updated description"
-            )
-            assert result is True
-
-            # Verify the update
-            config = manager.get_configuration()
-            assert config["severity_mapping"]["S1"]["name"] == "Updated Low"
-        finally:
-            os.unlink(temp_path)
-
-    def test_update_config_option_not_found(self):
-        """Test update_config_option when option not found."""
-        from app.data_utils import DHFDataManager
-
-        data = {
-            "configuration": {
-                "severity_mapping": {"S1": {"name": "Low", "description": "Low impact"}}
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            result = manager.update_config_option(
-                "severity", "S2", "Medium", "Medium impact"
-            )
-            assert result is False
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_severity_name(self):
-        """Test get_severity_name method."""
-        from app.data_utils import DHFDataManager
-
-        data = {
-            "configuration": {
-                "severity_mapping": {
-                    "S1": {"name": "Low", "description": "Low impact"},
-                    "S2": {"name": "Medium", "description": "Medium impact"},
-                }
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            assert manager.get_severity_name("S1") == "Low"
-            assert manager.get_severity_name("S2") == "Medium"
-            assert manager.get_severity_name("S3") == "S3"  # Returns ID if not found
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_probability_occurrence_name(self):
-        """Test get_probability_occurrence_name method."""
-        from app.data_utils import DHFDataManager
-
-        data = {
-            "configuration": {
-                "probability_occurrence_mapping": {
-                    "PO1": {"name": "Low", "description": "Unlikely"},
-                    "PO2": {"name": "Medium", "description": "Possible"},
-                }
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            assert manager.get_probability_occurrence_name("PO1") == "Low"
-            assert manager.get_probability_occurrence_name("PO2") == "Medium"
-            assert (
-                manager.get_probability_occurrence_name("PO3") == "PO3"
-            )  # Returns ID if not found
-        finally:
-            os.unlink(temp_path)
-
-    def test_get_probability_harm_name(self):
-        """Test get_probability_harm_name method."""
-        from app.data_utils import DHFDataManager
-
-        data = {
-            "configuration": {
-                "probability_harm_mapping": {
-                    "PH1": {"name": "Low", "description": "Unlikely to cause harm"},
-                    "PH2": {"name": "Medium", "description": "May cause harm"},
-                }
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            assert manager.get_probability_harm_name("PH1") == "Low"
-            assert manager.get_probability_harm_name("PH2") == "Medium"
-            assert (
-                manager.get_probability_harm_name("PH3") == "PH3"
-            )  # Returns ID if not found
-        finally:
-            os.unlink(temp_path)
-
-    def test_calculate_rbm_score(self):
+        manager = manager_factory(SEVERITY_CONFIG_YAML)
+        result = manager.update_config_option(
+            "severity", "S1", "Updated Low", "Updated description"
+        )
+        assert result is True
+
+        # Verify the update
+        config = manager.get_configuration()
+        assert config["severity_mapping"]["S1"]["name"] == "Updated Low"
+
+    @pytest.mark.parametrize(
+        "method, args, expected",
+        [
+            # An existing name still gets a new ID rather than failing
+            ("add_config_option", ("severity", "Low", "Low impact"), "S2"),
+            ("remove_config_option", ("severity", "S2"), False),
+            ("update_config_option", ("severity", "S2", "Medium", "Medium"), False),
+        ],
+        ids=["add_existing", "remove_not_found", "update_not_found"],
+    )
+    def test_config_option_result(self, manager_factory, method, args, expected):
+        """Test the result of config option changes that add nothing new."""
+        manager = manager_factory(SEVERITY_CONFIG_YAML)
+        assert getattr(manager, method)(*args) == expected
+
+    @pytest.mark.parametrize(
+        "getter, prefix",
+        [
+            ("get_severity_name", "S"),
+            ("get_probability_occurrence_name", "PO"),
+            ("get_probability_harm_name", "PH"),
+        ],
+    )
+    def test_get_option_name(self, manager_factory, getter, prefix):
+        """Test looking up each kind of option name."""
+        get_name = getattr(manager_factory(OPTION_NAMES_YAML), getter)
+        assert get_name(f"{prefix}1") == "Low"
+        assert get_name(f"{prefix}2") == "Medium"
+        # Returns the ID if not found
+        assert get_name(f"{prefix}3") == f"{prefix}3"
+
+    def test_calculate_rbm_score(self, manager_factory):
         """Test calculate_rbm_score method."""
-        from app.data_utils import DHFDataManager
-
         data = {
             "configuration": {
                 "severity_mapping": {
@@ -634,21 +335,12 @@ class TestDataUtilsCoverage:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
+        manager = manager_factory(data)
+        score = manager.calculate_rbm_score("PO2", "PH2", "S2")
+        assert score == 8  # 2 * 2 * 2
 
-        try:
-            manager = DHFDataManager(temp_path)
-            score = manager.calculate_rbm_score("PO2", "PH2", "S2")
-            assert score == 8  # 2 * 2 * 2
-        finally:
-            os.unlink(temp_path)
-
-    def test_calculate_rbm_score_edge_cases(self):
+    def test_calculate_rbm_score_edge_cases(self, manager_factory):
         """Test calculate_rbm_score with edge cases."""
-        from app.data_utils import DHFDataManager
-
         data = {
             "configuration": {
                 "severity_mapping": {"S1": {"name": "Low", "value": 1}},
@@ -657,18 +349,11 @@ class TestDataUtilsCoverage:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            yaml.dump(data, f)
-            temp_path = f.name
-
-        try:
-            manager = DHFDataManager(temp_path)
-            # Test with missing values
-            score = manager.calculate_rbm_score("PO1", "PH1", "S1")
-            assert score == 1  # 1 * 1 * 1
-
-            # Test with unknown values
-            score = manager.calculate_rbm_score("PO2", "PH2", "S2")
-            assert score == 8  # 2 * 2 * 2
-        finally:
-            os.unlink(temp_path)
+        manager = manager_factory(data)
+        # Test with missing values
+        score = manager.calculate_rbm_score("PO1", "PH1", "S1")
+        assert score == 1  # 1 * 1 * 1
+
+        # Test with unknown values
+        score = manager.calculate_rbm_score("PO2", "PH2", "S2")
+        assert score == 8  # 2 * 2 * 2
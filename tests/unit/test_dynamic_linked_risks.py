@@ -11,7 +11,9 @@ from unittest.mock import MagicMock, patch
 class TestDynamicLinkedRisks:
     """Test dynamic linked_risks functionality."""
 
-    def test_api_item_with_linked_risks_software_spec(self, app, client):
+    def test_api_item_with_linked_risks_software_spec(
+        self, app, client, patched_data_manager
+    ):
         """Test that software specifications get linked_risks dynamically added."""
         # Mock the data manager to return a software spec without linked_risks
         mock_data = {
@@ -47,24 +49,25 @@ class TestDynamicLinkedRisks:
             },
         }
 
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.get_item_by_id.return_value = mock_data["software_specifications"][
-                "sensor_processing"
-            ]["specifications"]["SS001"]
-            mock_dm.load_data.return_value = mock_data
-            mock_get_dm.return_value = mock_dm
-
-            response = client.get("/api/item/SS001")
-
-            assert response.status_code == 200
-            data = response.get_json()
-            assert "linked_risks" in data
-            assert data["linked_risks"] == ["R001"]
-            assert data["id"] == "SS001"
-            assert data["title"] == "Motion Sensor Fusion"
-
-    def test_api_item_with_linked_risks_hardware_spec(self, app, client):
+        patched_data_manager(
+            mock_data,
+            get_item_by_id=mock_data["software_specifications"]["sensor_processing"][
+                "specifications"
+            ]["SS001"],
+        )
+
+        response = client.get("/api/item/SS001")
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert "linked_risks" in data
+        assert data["linked_risks"] == ["R001"]
+        assert data["id"] == "SS001"
+        assert data["title"] == "Motion Sensor Fusion"
+
+    def test_api_item_with_linked_risks_hardware_spec(
+        self, app, client, patched_data_manager
+    ):
         """Test that hardware specifications get linked_risks dynamically added."""
         mock_data = {
             "hardware_specifications": {
@@ -99,24 +102,25 @@ class TestDynamicLinkedRisks:
             },
         }
 
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.get_item_by_id.return_value = mock_data["hardware_specifications"][
-                "sensors"
-            ]["specifications"]["HS001"]
-            mock_dm.load_data.return_value = mock_data
-            mock_get_dm.return_value = mock_dm
-
-            response = client.get("/api/item/HS001")
-
-            assert response.status_code == 200
-            data = response.get_json()
-            assert "linked_risks" in data
-            assert data["linked_risks"] == ["R001"]
-            assert data["id"] == "HS001"
-            assert data["title"] == "9-Axis IMU Sensor"
-
-    def test_api_item_with_multiple_linked_risks(self, app, client):
+        patched_data_manager(
+            mock_data,
+            get_item_by_id=mock_data["hardware_specifications"]["sensors"][
+                "specifications"
+            ]["HS001"],
+        )
+
+        response = client.get("/api/item/HS001")
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert "linked_risks" in data
+        assert data["linked_risks"] == ["R001"]
+        assert data["id"] == "HS001"
+        assert data["title"] == "9-Axis IMU Sensor"
+
+    def test_api_item_with_multiple_linked_risks(
+        self, app, client, patched_data_manager
+    ):
         """Test that specifications with multiple linked risks work correctly."""
         mock_data = {
             "software_specifications": {
@@ -161,23 +165,22 @@ class TestDynamicLinkedRisks:
             },
         }
 
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.get_item_by_id.return_value = mock_data["software_specifications"][
-                "sensor_processing"
-            ]["specifications"]["SS001"]
-            mock_dm.load_data.return_value = mock_data
-            mock_get_dm.return_value = mock_dm
+        patched_data_manager(
+            mock_data,
+            get_item_by_id=mock_data["software_specifications"]["sensor_processing"][
+                "specifications"
+            ]["SS001"],
+        )
 
-            response = client.get("/api/item/SS001")
+        response = client.get("/api/item/SS001")
 
-            assert response.status_code == 200
-            data = response.get_json()
-            assert "linked_risks" in data
-            assert set(data["linked_risks"]) == {"R001", "R002"}
-            assert len(data["linked_risks"]) == 2
+        assert response.status_code == 200
+        data = response.get_json()
+        assert "linked_risks" in data
+        assert set(data["linked_risks"]) == {"R001", "R002"}
+        assert len(data["linked_risks"]) == 2
 
-    def test_api_item_without_linked_risks(self, app, client):
+    def test_api_item_without_linked_risks(self, app, client, patched_data_manager):
         """Test that specifications without linked risks don't get the field added."""
         mock_data = {
             "software_specifications": {
@@ -196,22 +199,21 @@ class TestDynamicLinkedRisks:
             "risks": {},
         }
 
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.get_item_by_id.return_value = mock_data["software_specifications"][
-                "sensor_processing"
-            ]["specifications"]["SS001"]
-            mock_dm.load_data.return_value = mock_data
-            mock_get_dm.return_value = mock_dm
+        patched_data_manager(
+            mock_data,
+            get_item_by_id=mock_data["software_specifications"]["sensor_processing"][
+                "specifications"
+            ]["SS001"],
+        )
 
-            response = client.get("/api/item/SS001")
+        response = client.get("/api/item/SS001")
 
-            assert response.status_code == 200
-            data = response.get_json()
-            assert "linked_risks" not in data
-            assert data["id"] == "SS001"
+        assert response.status_code == 200
+        data = response.get_json()
+        assert "linked_risks" not in data
+        assert data["id"] == "SS001"
 
-    def test_api_item_non_specification_item(self, app, client):
+    def test_api_item_non_specification_item(self, app, client, patched_data_manager):
         """Test that non-specification items (user needs, risks, etc.) don't get linked_risks."""
         mock_data = {
             "user_needs": {
@@ -227,22 +229,19 @@ class TestDynamicLinkedRisks:
             }
         }
 
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.get_item_by_id.return_value = mock_data["user_needs"][
-                "performance"
-            ]["needs"]["UN001"]
-            mock_dm.load_data.return_value = mock_data
-            mock_get_dm.return_value = mock_dm
+        patched_data_manager(
+            mock_data,
+            get_item_by_id=mock_data["user_needs"]["performance"]["needs"]["UN001"],
+        )
 
-            response = client.get("/api/item/UN001")
+        response = client.get("/api/item/UN001")
 
-            assert response.status_code == 200
-            data = response.get_json()
-            assert "linked_risks" not in data
-            assert data["id"] == "UN001"
+        assert response.status_code == 200
+        data = response.get_json()
+        assert "linked_risks" not in data
+        assert data["id"] == "UN001"
 
-    def test_api_item_with_invalid_risk_id(self, app, client):
+    def test_api_item_with_invalid_risk_id(self, app, client, patched_data_manager):
         """Test that invalid risk IDs in mitigation links are handled gracefully."""
         mock_data = {
             "software_specifications": {
@@ -276,22 +275,21 @@ class TestDynamicLinkedRisks:
             },
         }
 
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.get_item_by_id.return_value = mock_data["software_specifications"][
-                "sensor_processing"
-            ]["specifications"]["SS001"]
-            mock_dm.load_data.return_value = mock_data
-            mock_get_dm.return_value = mock_dm
+        patched_data_manager(
+            mock_data,
+            get_item_by_id=mock_data["software_specifications"]["sensor_processing"][
+                "specifications"
+            ]["SS001"],
+        )
 
-            response = client.get("/api/item/SS001")
+        response = client.get("/api/item/SS001")
 
-            assert response.status_code == 200
-            data = response.get_json()
-            # Should not have linked_risks since the risk ID is invalid
-            assert "linked_risks" not in data
+        assert response.status_code == 200
+        data = response.get_json()
+        # Should not have linked_risks since the risk ID is invalid
+        assert "linked_risks" not in data
 
-    def test_api_item_with_missing_risk_data(self, app, client):
+    def test_api_item_with_missing_risk_data(self, app, client, patched_data_manager):
         """Test that missing risk data is handled gracefully."""
         mock_data = {
             "software_specifications": {
@@ -315,20 +313,19 @@ class TestDynamicLinkedRisks:
             "risks": {},  # Empty risks section
         }
 
-        with patch("app.routes.get_data_manager") as mock_get_dm:
-            mock_dm = MagicMock()
-            mock_dm.get_item_by_id.return_value = mock_data["software_specifications"][
-                "sensor_processing"
-            ]["specifications"]["SS001"]
-            mock_dm.load_data.return_value = mock_data
-            mock_get_dm.return_value = mock_dm
+        patched_data_manager(
+            mock_data,
+            get_item_by_id=mock_data["software_specifications"]["sensor_processing"][
+                "specifications"
+            ]["SS001"],
+        )
 
-            response = client.get("/api/item/SS001")
+        response = client.get("/api/item/SS001")
 
-            assert response.status_code == 200
-            data = response.get_json()
-            # Should not have linked_risks since the risk data is missing
-            assert "linked_risks" not in data
+        assert response.status_code == 200
+        data = response.get_json()
+        # Should not have linked_risks since the risk data is missing
+        assert "linked_risks" not in data
 
     def test_api_item_error_handling(self, app, client):
         """Test error handling in the linked_risks functionality."""
@@ -8,7 +8,7 @@
 import pytest
 import yaml
 
-from app.data_utils import DHFDataManager
+from app.data_utils import DHFDataManager, SafeDumper
 
 
 @pytest.mark.unit
@@ -106,7 +106,7 @@ class TestNestedRequirements:
         data_file = tmp_path / "nested_dhf_data.yaml"
 
         with open(data_file, "w") as f:
-            yaml.dump(nested_requirements_data, f)
+            yaml.dump(nested_requirements_data, f, Dumper=SafeDumper)
 
         return DHFDataManager(str(data_file))
 
@@ -240,7 +240,7 @@ class TestNestedRequirements:
 
         data_file = tmp_path / "mixed_dhf_data.yaml"
         with open(data_file, "w") as f:
-            yaml.dump(mixed_data, f)
+            yaml.dump(mixed_data, f, Dumper=SafeDumper)
 
         data_manager = DHFDataManager(str(data_file))
 
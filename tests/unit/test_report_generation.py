@@ -60,7 +60,7 @@ class TestReportGeneration:
                 ),
             ):
                 with patch("app.routes.get_data_manager") as mock_get_data_manager:
-                    mock_data_manager = MagicMock()
+                    mock_data_manager = MagicMock(data_version=None)
                     mock_data_manager.load_data.return_value = sample_dhf_data
                     mock_get_data_manager.return_value = mock_data_manager
                     content = generate_report_content("test_report")
@@ -87,6 +87,19 @@ class TestReportGeneration:
         assert "UN001" in result
         assert "Accurate Glucose Monitoring" in result
 
+    @pytest.mark.unit
+    def test_process_auto_content_reuses_tables_for_data_version(
+        self, sample_dhf_data, monkeypatch
+    ):
+        """Test that tables are generated once per data version."""
+        monkeypatch.setattr("app.routes.AUTO_CONTENT_CACHE", {})
+        content = "<!-- AUTO_CONTENT: user_needs_table -->"
+        first = process_auto_content(content, sample_dhf_data, data_version=-1)
+
+        sample_dhf_data["user_needs"] = {}
+        assert process_auto_content(content, sample_dhf_data, -1) == first
+        assert process_auto_content(content, sample_dhf_data, -2) != first
+
     @pytest.mark.unit
     def test_process_auto_content_product_requirements_tables(self, sample_dhf_data):
         """Test processing auto content for product requirements tables."""
@@ -257,7 +270,7 @@ class TestReportGeneration:
                 "builtins.open", mock_open(read_data=template_content)
             ):
                 with patch("app.routes.get_data_manager") as mock_get_data_manager:
-                    mock_data_manager = MagicMock()
+                    mock_data_manager = MagicMock(data_version=None)
                     mock_data_manager.load_data.return_value = sample_dhf_data
                     mock_get_data_manager.return_value = mock_data_manager
                     content = generate_report_content("test_report")
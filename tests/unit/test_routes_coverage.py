@@ -4,6 +4,7 @@
 """Additional tests to improve coverage of routes.py."""
 
 import json
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -256,30 +257,28 @@ class TestRoutesCoverage:
 
     # Git user info endpoints don't exist, so these tests are removed
 
-    def test_api_run_tests_route_success(self, client, data_manager):
+    def test_api_run_tests_route_success(self, client, data_manager, monkeypatch):
         """Test API run tests route success."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "Tests passed"
-            mock_run.return_value.stderr = ""
+        result = SimpleNamespace(returncode=0, stdout="Tests passed", stderr="")
+        monkeypatch.setattr("subprocess.run", lambda *args, **kwargs: result)
 
-            response = client.post("/api/run-tests")
-            assert response.status_code == 200
-            data = response.get_json()
-            assert data["success"] is True
+        response = client.post("/api/run-tests")
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["success"] is True
 
-    def test_api_run_tests_route_failure(self, client, data_manager):
+    def test_api_run_tests_route_failure(self, client, data_manager, monkeypatch):
         """Test API run tests route failure."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 1
-            mock_run.return_value.stdout = "Test output"
-            mock_run.return_value.stderr = "Test errors"
+        result = SimpleNamespace(
+            returncode=1, stdout="Test output", stderr="Test errors"
+        )
+        monkeypatch.setattr("subprocess.run", lambda *args, **kwargs: result)
 
-            response = client.post("/api/run-tests")
-            assert response.status_code == 200
-            data = response.get_json()
-            # The route always returns success=True, even on failure
-            assert data["success"] is True
+        response = client.post("/api/run-tests")
+        assert response.status_code == 200
+        data = response.get_json()
+        # The route always returns success=True, even on failure
+        assert data["success"] is True
 
     def test_process_auto_content_unknown_type(self, client, data_manager):
         """Test process_auto_content with unknown content type."""
@@ -325,6 +325,8 @@ class TestRoutesExtendedCoverage:
         """Test browse route with item_id parameter."""
         with patch("app.routes.get_data_manager") as mock_get_dm:
             mock_dm = MagicMock()
+            mock_dm.data_file_path = app.config["DHF_DATA_FILE"]
+            mock_dm.data_version = None
             mock_dm.load_data.return_value = {
                 "user_needs": {
                     "performance": {
@@ -347,6 +349,8 @@ class TestRoutesExtendedCoverage:
         """Test browse route with invalid item_id parameter."""
         with patch("app.routes.get_data_manager") as mock_get_dm:
             mock_dm = MagicMock()
+            mock_dm.data_file_path = app.config["DHF_DATA_FILE"]
+            mock_dm.data_version = None
             mock_dm.load_data.return_value = {
                 "user_needs": {},
                 "product_requirements": {},
@@ -365,6 +369,8 @@ class TestRoutesExtendedCoverage:
         """Test browse route exception handling."""
         with patch("app.routes.get_data_manager") as mock_get_dm:
             mock_dm = MagicMock()
+            mock_dm.data_file_path = app.config["DHF_DATA_FILE"]
+            mock_dm.data_version = None
             mock_dm.load_data.side_effect = Exception("Database error")
             mock_get_dm.return_value = mock_dm
 
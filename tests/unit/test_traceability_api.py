@@ -7,14 +7,35 @@
 
 import pytest
 
+TRACEABILITY_ENDPOINTS = (
+    "/api/traceability/user-needs-to-requirements",
+    "/api/traceability/requirements-to-specifications",
+    "/api/traceability/risks-to-mitigations",
+)
+
+
+@pytest.fixture(scope="module")
+def traceability_responses(get_page):
+    """Responses from each traceability endpoint, fetched once per session."""
+    return {endpoint: get_page(endpoint) for endpoint in TRACEABILITY_ENDPOINTS}
+
 
 @pytest.mark.api
 class TestTraceabilityAPI:
     """Test traceability API endpoints."""
 
-    def test_user_needs_to_requirements_traceability(self, client, data_manager):
+    @pytest.mark.parametrize("endpoint", TRACEABILITY_ENDPOINTS)
+    def test_traceability_endpoint_returns_list(self, traceability_responses, endpoint):
+        """Test that each traceability endpoint returns a JSON list."""
+        response = traceability_responses[endpoint]
+        assert response.status_code == 200
+        assert isinstance(response.get_json(), list)
+
+    def test_user_needs_to_requirements_traceability(self, traceability_responses):
         """Test user needs to product requirements traceability endpoint."""
-        response = client.get("/api/traceability/user-needs-to-requirements")
+        response = traceability_responses[
+            "/api/traceability/user-needs-to-requirements"
+        ]
 
         assert response.status_code == 200
         data = response.get_json()
@@ -31,9 +52,11 @@ class TestTraceabilityAPI:
         assert "title" in first_item["user_need"]
         assert isinstance(first_item["requirements"], list)
 
-    def test_requirements_to_specifications_traceability(self, client, data_manager):
+    def test_requirements_to_specifications_traceability(self, traceability_responses):
         """Test product requirements to specifications traceability endpoint."""
-        response = client.get("/api/traceability/requirements-to-specifications")
+        response = traceability_responses[
+            "/api/traceability/requirements-to-specifications"
+        ]
 
         assert response.status_code == 200
         data = response.get_json()
@@ -52,9 +75,9 @@ class TestTraceabilityAPI:
         assert isinstance(first_item["software_specs"], list)
         assert isinstance(first_item["hardware_specs"], list)
 
-    def test_risks_to_mitigations_traceability(self, client, data_manager):
+    def test_risks_to_mitigations_traceability(self, traceability_responses):
         """Test risks to mitigations traceability endpoint."""
-        response = client.get("/api/traceability/risks-to-mitigations")
+        response = traceability_responses["/api/traceability/risks-to-mitigations"]
 
         assert response.status_code == 200
         data = response.get_json()
@@ -71,48 +94,35 @@ class TestTraceabilityAPI:
         assert "title" in first_item["risk"]
         assert isinstance(first_item["mitigations"], list)
 
-    def test_traceability_endpoints_with_empty_data(self):
+    def test_traceability_endpoints_with_empty_data(self, monkeypatch, tmp_path):
         """Test traceability endpoints with empty data."""
         # Create a new app with empty data
-        import os
-        import tempfile
-
         from app import create_app
 
         # Create empty data file
-        db_fd, db_path = tempfile.mkstemp()
-        with open(db_path, "w") as f:
-            f.write("{}")
-
-        try:
-            # Create app without using the fixture
-            app = create_app(data_file_path=db_path)
-            app.config["TESTING"] = True
-            test_client = app.test_client()
-
-            # Test all traceability endpoints
-            endpoints = [
-                "/api/traceability/user-needs-to-requirements",
-                "/api/traceability/requirements-to-specifications",
-                "/api/traceability/risks-to-mitigations",
-            ]
-
-            for endpoint in endpoints:
-                response = test_client.get(endpoint)
-                assert response.status_code == 200
-                data = response.get_json()
-                assert isinstance(data, list)
-                # The test data might have some items even with empty file
-                assert isinstance(data, list)
-
-        finally:
-            os.close(db_fd)
-            os.unlink(db_path)
-
-    def test_traceability_data_structure_consistency(self, client, data_manager):
+        db_path = tmp_path / "dhf.yaml"
+        db_path.write_text("{}")
+
+        # Create app without using the fixture
+        app = create_app(data_file_path=str(db_path))
+        app.config["TESTING"] = True
+        # Use a manager bound to this app's file, not the shared one
+        monkeypatch.setattr("app.routes.data_manager", None)
+        test_client = app.test_client()
+
+        # Test all traceability endpoints
+        for endpoint in TRACEABILITY_ENDPOINTS:
+            response = test_client.get(endpoint)
+            assert response.status_code == 200
+            data = response.get_json()
+            assert isinstance(data, list)
+            # The test data might have some items even with empty file
+            assert isinstance(data, list)
+
+    def test_traceability_data_structure_consistency(self, traceability_responses):
         """Test that traceability data has consistent structure."""
         # Test user needs to requirements
-        response = client.get("/api/traceability/user-needs-to-requirements")
+        response = traceability_responses[TRACEABILITY_ENDPOINTS[0]]
         data = response.get_json()
 
         for item in data:
@@ -125,10 +135,12 @@ class TestTraceabilityAPI:
                 assert "id" in req
                 assert "title" in req
 
-    def test_traceability_links_are_valid(self, client, data_manager):
+    def test_traceability_links_are_valid(
+        self, client, data_manager, traceability_responses
+    ):
         """Test that traceability links reference valid items."""
         # Test user needs to requirements
-        response = client.get("/api/traceability/user-needs-to-requirements")
+        response = traceability_responses[TRACEABILITY_ENDPOINTS[0]]
         data = response.get_json()
 
         for item in data: